@@ -74,7 +74,7 @@ fi
 echo -e "${YELLOW}Installing Lambda dependencies...${NC}"
 # Install only runtime dependencies (not dev dependencies) to lambda directory
 # Use pip with --platform to get Linux x86_64 binaries compatible with Lambda
-pip install anthropic boto3 markdown --target lambda/ --upgrade \
+pip install anthropic boto3 httpx markdown --target lambda/ --upgrade \
     --platform manylinux2014_x86_64 --python-version 3.12 --only-binary=:all:
 
 echo -e "${GREEN}✓ Dependencies installed${NC}"
@@ -93,6 +93,22 @@ echo -e "${GREEN}✓ CDK stack synthesized${NC}"
 echo -e "${YELLOW}Deploying CDK stack...${NC}"
 cdk deploy --require-approval never
 
+# Store the API key in Secrets Manager rather than the Lambda environment
+echo -e "${YELLOW}Storing Anthropic API key in Secrets Manager...${NC}"
+SECRET_ARN=$(aws cloudformation describe-stacks \
+    --stack-name DailyBriefingStack \
+    --query 'Stacks[0].Outputs[?OutputKey==`AnthropicApiKeySecretArn`].OutputValue' \
+    --output text)
+CURRENT_KEY=$(aws secretsmanager get-secret-value --secret-id "$SECRET_ARN" \
+    --query SecretString --output text 2>/dev/null || echo "")
+if [ "$CURRENT_KEY" != "$ANTHROPIC_API_KEY" ]; then
+    aws secretsmanager put-secret-value --secret-id "$SECRET_ARN" \
+        --secret-string "$ANTHROPIC_API_KEY" > /dev/null
+    echo -e "${GREEN}✓ API key updated (picked up by the function within 5 minutes)${NC}"
+else
+    echo -e "${GREEN}✓ API key already up to date${NC}"
+fi
+
 echo ""
 echo -e "${GREEN}========================================${NC}"
 echo -e "${GREEN}Deployment completed successfully!${NC}"
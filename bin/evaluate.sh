@@ -0,0 +1,40 @@
+#!/bin/bash
+
+# Backfill briefings and compare prompt variants without sending email
+# All arguments are passed through to lambda/evaluation.py, e.g.:
+#   ./bin/evaluate.sh --start 2026-01-05 --end 2026-01-09 \
+#       --variant baseline=lambda/prompt.md --variant terse=prompts/terse.md
+#   ./bin/evaluate.sh --replay recordings/ --variant baseline=lambda/prompt.md
+
+set -e
+
+# Colors for output
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+NC='\033[0m' # No Color
+
+echo -e "${GREEN}Daily Briefing Evaluation Runner${NC}"
+echo "======================================"
+
+# Load environment variables (only the API key is needed, and not for --replay)
+if [ -f .env ]; then
+    echo -e "${YELLOW}Loading environment variables...${NC}"
+    export $(cat .env | grep -v '^#' | xargs)
+fi
+
+# Offline replays (--replay DIR or --replay=DIR) don't call the API
+REPLAY=false
+for arg in "$@"; do
+    case "$arg" in
+        --replay|--replay=*) REPLAY=true ;;
+    esac
+done
+
+if [ -z "$ANTHROPIC_API_KEY" ] && [ "$REPLAY" = false ]; then
+    echo -e "${RED}Error: ANTHROPIC_API_KEY is not set${NC}"
+    echo "Set it in your .env file, or run offline with --replay DIR"
+    exit 1
+fi
+
+python3 lambda/evaluation.py "$@"
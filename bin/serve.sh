@@ -0,0 +1,24 @@
+#!/bin/bash
+
+# Preview stored briefings locally through the same code as the archive endpoint
+# All arguments are passed through to lambda/archive_server.py, e.g.:
+#   ./bin/serve.sh --archive archive/
+#   ./bin/serve.sh --bucket my-briefing-archive-bucket --port 8080
+
+set -e
+
+# Colors for output
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+NC='\033[0m' # No Color
+
+echo -e "${GREEN}Daily Briefing Archive Server${NC}"
+echo "======================================"
+
+# Load environment variables (BRIEFING_ARCHIVE_DIR or BRIEFING_BUCKET, if set)
+if [ -f .env ]; then
+    echo -e "${YELLOW}Loading environment variables...${NC}"
+    export $(cat .env | grep -v '^#' | xargs)
+fi
+
+python3 lambda/archive_server.py "$@"
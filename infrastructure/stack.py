@@ -1,7 +1,11 @@
 from aws_cdk import (
     Stack,
     Duration,
+    RemovalPolicy,
     aws_lambda as lambda_,
+    aws_s3 as s3,
+    aws_secretsmanager as secretsmanager,
+    aws_ssm as ssm,
     aws_events as events,
     aws_events_targets as targets,
     aws_iam as iam,
@@ -19,17 +23,48 @@ class DailyBriefingStack(Stack):
         super().__init__(scope, construct_id, **kwargs)
 
         # Get configuration from environment variables
-        anthropic_api_key = os.environ.get("ANTHROPIC_API_KEY")
+        # The API key is never put in the template; bin/deploy.sh writes it to the secret below
         recipient_email = os.environ.get("RECIPIENT_EMAIL")
         sender_email = os.environ.get("SENDER_EMAIL")
 
-        if not anthropic_api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable is required")
         if not recipient_email:
             raise ValueError("RECIPIENT_EMAIL environment variable is required")
         if not sender_email:
             raise ValueError("SENDER_EMAIL environment variable is required")
 
+        # Anthropic API key, read at runtime and cached across warm invocations
+        api_key_secret = secretsmanager.Secret(
+            self,
+            "AnthropicApiKeySecret",
+            description="Anthropic API key for the daily briefing (set by bin/deploy.sh)",
+        )
+
+        # Email addresses, editable with `aws ssm put-parameter --overwrite` without a redeploy
+        sender_email_param = ssm.StringParameter(
+            self,
+            "SenderEmailParameter",
+            parameter_name="/daily-briefing/sender-email",
+            string_value=sender_email,
+            description="Verified SES sender address for the daily briefing",
+        )
+        recipient_email_param = ssm.StringParameter(
+            self,
+            "RecipientEmailParameter",
+            parameter_name="/daily-briefing/recipient-email",
+            string_value=recipient_email,
+            description="Recipient address for the daily briefing",
+        )
+
+        # Archive of generated briefings, used to build the weekly digest
+        archive_bucket = s3.Bucket(
+            self,
+            "BriefingArchiveBucket",
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            enforce_ssl=True,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
         # Create Lambda function
         briefing_lambda = lambda_.Function(
             self,
@@ -40,9 +75,15 @@ class DailyBriefingStack(Stack):
             timeout=Duration.minutes(5),
             memory_size=512,
             environment={
-                "ANTHROPIC_API_KEY": anthropic_api_key,
-                "RECIPIENT_EMAIL": recipient_email,
-                "SENDER_EMAIL": sender_email,
+                "ANTHROPIC_SECRET_ID": api_key_secret.secret_arn,
+                "SENDER_EMAIL_PARAM": sender_email_param.parameter_name,
+                "RECIPIENT_EMAIL_PARAM": recipient_email_param.parameter_name,
+                "LINK_CHECK_MODE": os.environ.get("LINK_CHECK_MODE", "annotate"),
+                "BRIEFING_BUCKET": archive_bucket.bucket_name,
+                "MODEL_STREAMING": "true",
+                "TRACE_EXPORTER": "emf",
+                "DELTA_COST_TARGET_USD": os.environ.get("DELTA_COST_TARGET_USD", "0.05"),
+                "DELTA_LATENCY_TARGET_SECONDS": os.environ.get("DELTA_LATENCY_TARGET_SECONDS", "60"),
             },
             log_retention=logs.RetentionDays.ONE_WEEK,
             description="Generates and emails daily briefings using Claude API",
@@ -59,6 +100,44 @@ class DailyBriefingStack(Stack):
             )
         )
 
+        archive_bucket.grant_read_write(briefing_lambda)
+        api_key_secret.grant_read(briefing_lambda)
+        sender_email_param.grant_read(briefing_lambda)
+        recipient_email_param.grant_read(briefing_lambda)
+
+        # Archive URL accepts signed (IAM) requests only, unless public access is
+        # opted into with ARCHIVE_URL_AUTH=NONE
+        archive_url_auth = os.environ.get("ARCHIVE_URL_AUTH", "AWS_IAM").upper()
+        if archive_url_auth not in ("AWS_IAM", "NONE"):
+            raise ValueError(
+                f"ARCHIVE_URL_AUTH must be AWS_IAM or NONE, got {archive_url_auth!r}"
+            )
+
+        # Read-only archive endpoint; it serves stored briefings and never calls the model,
+        # so it gets no secret, no SES access and only read access to the bucket
+        archive_lambda = lambda_.Function(
+            self,
+            "BriefingArchiveFunction",
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            handler="archive_server.handler",
+            code=lambda_.Code.from_asset("lambda"),
+            timeout=Duration.seconds(10),
+            memory_size=256,
+            environment={
+                "BRIEFING_BUCKET": archive_bucket.bucket_name,
+                "ARCHIVE_CACHE_TTL": "300",
+                "ARCHIVE_CACHE_SCOPE": "public" if archive_url_auth == "NONE" else "private",
+            },
+            log_retention=logs.RetentionDays.ONE_WEEK,
+            description="Serves archived briefings as HTML and JSON",
+        )
+
+        archive_bucket.grant_read(archive_lambda)
+
+        archive_url = archive_lambda.add_function_url(
+            auth_type=lambda_.FunctionUrlAuthType[archive_url_auth],
+        )
+
         # Create EventBridge rule to trigger daily at 5 AM Central time (11 AM UTC)
         # Note: During daylight saving time (CDT), this will be 6 AM local time
         rule = events.Rule(
@@ -77,6 +156,45 @@ class DailyBriefingStack(Stack):
         # Add Lambda as target
         rule.add_target(targets.LambdaFunction(briefing_lambda))
 
+        # Weekly digest on Mondays, an hour after the daily briefing has been stored
+        weekly_rule = events.Rule(
+            self,
+            "WeeklyDigestSchedule",
+            schedule=events.Schedule.cron(
+                minute="0",
+                hour="12",
+                month="*",
+                week_day="MON",
+                year="*"
+            ),
+            description="Triggers the weekly digest every Monday from stored briefings",
+        )
+
+        weekly_rule.add_target(targets.LambdaFunction(
+            briefing_lambda,
+            event=events.RuleTargetInput.from_object({"mode": "weekly_digest"}),
+        ))
+
+        # Hourly delta scans through the working day after the morning briefing;
+        # they only send an email when something scores 9-10
+        delta_rule = events.Rule(
+            self,
+            "DeltaScanSchedule",
+            schedule=events.Schedule.cron(
+                minute="0",
+                hour="12-23",  # 6 AM - 5 PM CST (7 AM - 6 PM CDT)
+                month="*",
+                week_day="*",
+                year="*"
+            ),
+            description="Triggers an hourly scan for new high-priority developments",
+        )
+
+        delta_rule.add_target(targets.LambdaFunction(
+            briefing_lambda,
+            event=events.RuleTargetInput.from_object({"mode": "delta"}),
+        ))
+
         # Output the Lambda function name for easy invocation
         CfnOutput(
             self,
@@ -91,3 +209,24 @@ class DailyBriefingStack(Stack):
             value=briefing_lambda.function_arn,
             description="ARN of the daily briefing Lambda function",
         )
+
+        CfnOutput(
+            self,
+            "AnthropicApiKeySecretArn",
+            value=api_key_secret.secret_arn,
+            description="Secrets Manager secret holding the Anthropic API key",
+        )
+
+        CfnOutput(
+            self,
+            "BriefingArchiveBucketName",
+            value=archive_bucket.bucket_name,
+            description="S3 bucket holding the archived briefings",
+        )
+
+        CfnOutput(
+            self,
+            "BriefingArchiveUrl",
+            value=archive_url.url,
+            description="URL serving the latest and archived briefings",
+        )
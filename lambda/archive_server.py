@@ -0,0 +1,277 @@
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Any, List, Optional, Tuple
+from briefing_store import BriefingStore
+from rendering import render_html
+
+
+DEFAULT_CACHE_TTL = 300
+# Dated briefings are only replaced by an explicit re-run, so they may be kept for a day
+DATED_CACHE_SECONDS = 86400
+LATEST_CACHE_SECONDS = 300
+MAX_CACHE_ENTRIES = 256
+
+# Fields published by the .json routes; thinking, usage, citations and link
+# checks stay internal
+PUBLIC_FIELDS = ("title", "date", "date_iso", "briefing", "model", "timestamp")
+
+ROUTE_PATTERN = re.compile(r"^/(?:briefings/(?P<date>\d{4}-\d{2}-\d{2})|(?P<name>latest|briefings|index))?(?P<json>\.json)?/?$")
+
+
+class ArchiveServer:
+    """
+    Read-only HTTP view of the stored briefings.
+
+    Routes (each also available as JSON, limited to PUBLIC_FIELDS, by
+    appending ".json"):
+        /                      latest briefing
+        /latest                latest briefing
+        /briefings/YYYY-MM-DD  briefing for a date
+        /briefings             index of stored dates
+
+    Only stored artifacts are read; the model is never called. Rendered
+    responses are kept in memory, dated briefings for a day and the
+    latest/index views for cache_ttl seconds, so warm requests skip both the
+    store and rendering.
+    """
+
+    def __init__(self, store: BriefingStore = None, cache_ttl: float = None, cache_scope: str = None):
+        self.store = store if store is not None else BriefingStore()
+        if cache_ttl is None:
+            cache_ttl = float(os.environ.get("ARCHIVE_CACHE_TTL", DEFAULT_CACHE_TTL))
+        self.cache_ttl = cache_ttl
+        # "private" keeps shared caches from storing responses to signed requests
+        self.cache_scope = cache_scope or os.environ.get("ARCHIVE_CACHE_SCOPE", "public")
+        self.cache: Dict[str, Dict[str, Any]] = {}
+
+    def respond(self, method: str, path: str, headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Answer one request.
+
+        Args:
+            method: HTTP method
+            path: Request path, without the query string
+            headers: Request headers (any case)
+
+        Returns:
+            Tuple of (status code, response headers, body)
+        """
+        if method not in ("GET", "HEAD"):
+            return 405, {"Allow": "GET, HEAD", "Content-Type": "text/plain; charset=utf-8"}, b"Method Not Allowed"
+
+        match = ROUTE_PATTERN.match(path)
+        if match is None:
+            return 404, {"Content-Type": "text/plain; charset=utf-8"}, b"Not Found"
+
+        cache_key = path.rstrip("/") or "/"
+        entry = self._cached(cache_key, match)
+        if entry is None:
+            return 404, {"Content-Type": "text/plain; charset=utf-8", "Cache-Control": "no-store"}, b"Not Found"
+
+        response_headers = {
+            "Content-Type": entry["content_type"],
+            "ETag": entry["etag"],
+            "Last-Modified": entry["last_modified"],
+            "Cache-Control": entry["cache_control"],
+        }
+        if self._not_modified(entry, {key.lower(): value for key, value in headers.items()}):
+            return 304, response_headers, b""
+
+        response_headers["Content-Length"] = str(len(entry["body"]))
+        return 200, response_headers, b"" if method == "HEAD" else entry["body"]
+
+    def _cached(self, cache_key: str, match: re.Match) -> Optional[Dict[str, Any]]:
+        entry = self.cache.get(cache_key)
+        if entry is not None and time.monotonic() < entry["expires"]:
+            return entry
+
+        entry = self._build(match)
+        if entry is None:
+            return None
+
+        if len(self.cache) >= MAX_CACHE_ENTRIES:
+            self.cache.pop(next(iter(self.cache)))
+        self.cache[cache_key] = entry
+        return entry
+
+    def _build(self, match: re.Match) -> Optional[Dict[str, Any]]:
+        as_json = bool(match.group("json"))
+        date_iso = match.group("date")
+        name = match.group("name")
+
+        if name in ("briefings", "index"):
+            dates = self.store.list_dates()
+            latest = self.store.load(dates[-1]) if dates else None
+            if as_json:
+                body = _json_body({"dates": dates})
+            else:
+                body = _index_html(dates).encode("utf-8")
+            modified = latest["timestamp"] if latest else None
+            expires = time.monotonic() + self.cache_ttl
+            cache_control = f"{self.cache_scope}, max-age={LATEST_CACHE_SECONDS}"
+        else:
+            if date_iso:
+                briefing_data = self.store.load(date_iso)
+                expires = time.monotonic() + DATED_CACHE_SECONDS
+                cache_control = f"{self.cache_scope}, max-age={DATED_CACHE_SECONDS}"
+            else:
+                briefing_data = self.store.latest()
+                expires = time.monotonic() + self.cache_ttl
+                cache_control = f"{self.cache_scope}, max-age={LATEST_CACHE_SECONDS}"
+            if briefing_data is None:
+                return None
+            if as_json:
+                body = _json_body({key: briefing_data[key] for key in PUBLIC_FIELDS if key in briefing_data})
+            else:
+                # Model output may contain raw HTML; browsers, unlike mail clients, would run it
+                body = render_html(briefing_data, allow_raw_html=False).encode("utf-8")
+            modified = briefing_data.get("timestamp")
+
+        return {
+            "body": body,
+            "content_type": "application/json" if as_json else "text/html; charset=utf-8",
+            "etag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            "last_modified": _http_date(modified),
+            "modified_at": _parse_timestamp(modified),
+            "cache_control": cache_control,
+            "expires": expires,
+        }
+
+    @staticmethod
+    def _not_modified(entry: Dict[str, Any], headers: Dict[str, str]) -> bool:
+        # If-None-Match takes precedence over If-Modified-Since when both are sent
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            # Weak comparison, as for any GET: a proxy may hand back W/"..."
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            return "*" in tags or entry["etag"] in tags
+
+        if_modified_since = headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since is None:
+                return False
+            # A "-0000" zone parses as naive; it is still a UTC time
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return entry["modified_at"].replace(microsecond=0) <= since
+        return False
+
+
+def _parse_timestamp(timestamp: Optional[str]) -> datetime:
+    """Parse a stored ISO timestamp (naive timestamps are UTC, as on Lambda)."""
+    if not timestamp:
+        return datetime.fromtimestamp(0, tz=timezone.utc)
+    parsed = datetime.fromisoformat(timestamp)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _http_date(timestamp: Optional[str]) -> str:
+    return format_datetime(_parse_timestamp(timestamp), usegmt=True)
+
+
+def _json_body(data: Dict[str, Any]) -> bytes:
+    # Sorted keys keep the bytes, and so the ETag, stable across cold starts
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+def _index_html(dates: List[str]) -> str:
+    links = "\n".join(
+        f'<li><a href="/briefings/{date}">{date}</a> (<a href="/briefings/{date}.json">json</a>)</li>'
+        for date in reversed(dates)
+    )
+    return f"""<html>
+<head><title>Briefing Archive</title></head>
+<body style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px;">
+<h1>Briefing Archive</h1>
+<p><a href="/latest">Latest briefing</a></p>
+<ul>
+{links or "<li>No briefings stored yet.</li>"}
+</ul>
+</body>
+</html>
+"""
+
+
+# Module-level so the response cache survives warm Lambda invocations
+_server: Optional[ArchiveServer] = None
+
+
+def _get_server() -> ArchiveServer:
+    global _server
+    if _server is None:
+        _server = ArchiveServer()
+    return _server
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    AWS Lambda Function URL handler serving the briefing archive.
+
+    Args:
+        event: Function URL event (payload format 2.0)
+        context: Lambda context object
+
+    Returns:
+        Function URL response with status, headers and body
+    """
+    method = event.get("requestContext", {}).get("http", {}).get("method", "GET")
+    status, headers, body = _get_server().respond(method, event.get("rawPath", "/"), event.get("headers") or {})
+    return {
+        "statusCode": status,
+        "headers": headers,
+        "body": body.decode("utf-8"),
+        "isBase64Encoded": False,
+    }
+
+
+class WSGIApp:
+    """Local stand-in for the Function URL, e.g. for previewing a local archive."""
+
+    def __init__(self, server: ArchiveServer = None):
+        self.server = server if server is not None else ArchiveServer()
+
+    def __call__(self, environ: Dict[str, Any], start_response: Any) -> List[bytes]:
+        headers = {
+            key[len("HTTP_"):].replace("_", "-"): value
+            for key, value in environ.items() if key.startswith("HTTP_")
+        }
+        status, response_headers, body = self.server.respond(
+            environ.get("REQUEST_METHOD", "GET"), environ.get("PATH_INFO") or "/", headers
+        )
+        reason = {200: "OK", 304: "Not Modified", 404: "Not Found", 405: "Method Not Allowed"}[status]
+        start_response(f"{status} {reason}", list(response_headers.items()))
+        return [body]
+
+
+def main(argv: List[str] = None) -> int:
+    from wsgiref.simple_server import make_server
+
+    parser = argparse.ArgumentParser(description="Serve stored briefings locally")
+    parser.add_argument("--archive", help="Local archive directory (defaults to BRIEFING_ARCHIVE_DIR)")
+    parser.add_argument("--bucket", help="S3 bucket to read instead (defaults to BRIEFING_BUCKET)")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    store = BriefingStore(bucket=args.bucket, directory=args.archive)
+    if not store.enabled:
+        raise ValueError("BRIEFING_BUCKET or BRIEFING_ARCHIVE_DIR environment variable is required")
+
+    with make_server("127.0.0.1", args.port, WSGIApp(ArchiveServer(store))) as httpd:
+        print(f"Serving briefings on http://127.0.0.1:{args.port}/")
+        httpd.serve_forever()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
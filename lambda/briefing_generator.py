@@ -1,22 +1,63 @@
 import os
 import json
+import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from pathlib import Path
 import anthropic
+from citations import audit_links, extract_citations
+from credentials import get_anthropic_api_key
+from tracing import span
+
+
+# USD per million tokens, and per web search
+MODEL_PRICING = {
+    "claude-opus-4-5-20251101": {"input": 5.00, "output": 25.00},
+    "claude-sonnet-4-5-20250929": {"input": 3.00, "output": 15.00},
+    "claude-haiku-4-5-20251001": {"input": 1.00, "output": 5.00},
+}
+WEB_SEARCH_PRICE = 0.01
+
+
+def estimate_cost(model: str, usage: Dict[str, int]) -> float:
+    """
+    Estimate the USD cost of a request from its token and search usage.
+
+    Args:
+        model: Model the request was sent to
+        usage: Usage dict as returned in generate_briefing's "usage"
+
+    Returns:
+        Estimated cost in USD (0.0 for models without known pricing)
+    """
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None:
+        return 0.0
+    return (
+        usage.get("input_tokens", 0) * pricing["input"] / 1_000_000
+        + usage.get("output_tokens", 0) * pricing["output"] / 1_000_000
+        + usage.get("web_search_requests", 0) * WEB_SEARCH_PRICE
+    )
 
 
 class BriefingGenerator:
     """Generates daily briefings using Claude API with extended thinking."""
 
-    def __init__(self, prompt_file: str = None):
-        self.api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not self.api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+    def __init__(self, prompt_file: str = None, client: Any = None, stream: bool = None):
+        if client is None:
+            self.api_key = get_anthropic_api_key()
+            if not self.api_key:
+                raise ValueError("ANTHROPIC_API_KEY environment variable (or ANTHROPIC_SECRET_ID) is required")
+            client = anthropic.Anthropic(api_key=self.api_key)
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = client
         self.model = "claude-sonnet-4-5-20250929"
 
+        # Streaming lets us measure time to first token; off unless asked for
+        if stream is None:
+            stream = os.environ.get("MODEL_STREAMING", "false").lower() == "true"
+        self.stream = stream
+
         # Set default prompt file location
         if prompt_file is None:
             prompt_file = os.path.join(os.path.dirname(__file__), "prompt.md")
@@ -47,21 +88,139 @@ class BriefingGenerator:
         except Exception as e:
             raise Exception(f"Failed to load prompt template: {str(e)}")
 
-    def generate_briefing(self) -> Dict[str, Any]:
+    def filter_narration(self, briefing_content: str) -> Tuple[str, int]:
+        """
+        Remove research-process narration the model leaked into the briefing.
+
+        Args:
+            briefing_content: Raw briefing text
+
+        Returns:
+            Tuple of the cleaned briefing and the number of lines removed
+        """
+        lines = briefing_content.split('\n')
+        filtered_lines = []
+        skip_until_heading = False
+
+        for i, line in enumerate(lines):
+            line_lower = line.lower().strip()
+
+            # If we find obvious process narration, skip until we hit a heading
+            if any(phrase in line_lower for phrase in [
+                "research phase", "information gathering", "let me conduct",
+                "i'll conduct a comprehensive", "let me start by executing"
+            ]):
+                skip_until_heading = True
+                continue
+
+            # If we're skipping, only include headings (they mark the start of real content)
+            if skip_until_heading:
+                if line.strip().startswith('#'):
+                    skip_until_heading = False
+                    filtered_lines.append(line)
+                continue
+
+            # Skip other obvious process narration lines (but keep headings)
+            if any(phrase in line_lower for phrase in [
+                "let me search", "i'll search", "now let me", "let me fetch",
+                "executing searches", "searching for", "let me look"
+            ]) and not line.strip().startswith('#'):
+                continue
+
+            filtered_lines.append(line)
+
+        return '\n'.join(filtered_lines).strip(), len(lines) - len(filtered_lines)
+
+    def create_message(self, **request) -> Any:
+        """
+        Send a Messages API request, recording model latency on the current span.
+
+        When streaming is enabled the time to first token is recorded too;
+        the full message is still returned once the stream completes.
+
+        Args:
+            **request: Keyword arguments for messages.create
+
+        Returns:
+            The complete API response message
+        """
+        with span("model", model=request.get("model"), stream=self.stream) as model_span:
+            start = time.perf_counter()
+            if self.stream:
+                with self.client.messages.stream(**request) as stream:
+                    # message_start and content_block_start arrive before any content;
+                    # the first delta is the first generated (thinking, text or tool) token
+                    for event in stream:
+                        if event.type == "content_block_delta":
+                            model_span.metric("TimeToFirstToken", round((time.perf_counter() - start) * 1000, 3),
+                                              "Milliseconds")
+                            break
+                    response = stream.get_final_message()
+            else:
+                response = self.client.messages.create(**request)
+            model_span.metric("ModelLatency", round((time.perf_counter() - start) * 1000, 3), "Milliseconds")
+
+            usage = getattr(response, "usage", None)
+            if isinstance(getattr(usage, "input_tokens", None), int):
+                model_span.metric("InputTokens", usage.input_tokens, "Count")
+                model_span.metric("OutputTokens", usage.output_tokens, "Count")
+            return response
+
+    def read_response(self, response: Any) -> Dict[str, Any]:
+        """
+        Split a response into its final text, thinking, search citations and usage.
+
+        Args:
+            response: Messages API response
+
+        Returns:
+            Dict with "text", "thinking", "citations" (see citations.extract_citations)
+            and "usage" (input_tokens, output_tokens, web_search_requests)
+        """
+        # Only include the final text response, not intermediate tool use announcements
+        text = ""
+        thinking = ""
+        for block in response.content:
+            if block.type == "thinking":
+                thinking = block.thinking
+            elif block.type == "text":
+                text += block.text + "\n"
+            # server_tool_use and web_search_tool_result blocks are intermediate steps;
+            # their results are kept only as the citation table
+
+        return {
+            "text": text,
+            "thinking": thinking,
+            "citations": extract_citations(response.content),
+            "usage": {
+                "input_tokens": response.usage.input_tokens,
+                "output_tokens": response.usage.output_tokens,
+                "web_search_requests": getattr(
+                    getattr(response.usage, "server_tool_use", None), "web_search_requests", 0
+                ) or 0,
+            },
+        }
+
+    def generate_briefing(self, date: datetime = None) -> Dict[str, Any]:
         """
         Generate a daily briefing using Claude with extended thinking.
 
+        Args:
+            date: Day to write the briefing for (defaults to today)
+
         Returns:
             Dict containing the briefing content and metadata
         """
-        today = datetime.now().strftime("%B %d, %Y")
+        now = date or datetime.now()
+        today = now.strftime("%B %d, %Y")
 
         # Load and format the prompt template
-        prompt_template = self.load_prompt_template()
-        prompt = prompt_template.format(date=today)
+        with span("prompt.load"):
+            prompt_template = self.load_prompt_template()
+            prompt = prompt_template.format(date=today)
 
         try:
-            response = self.client.messages.create(
+            response = self.create_message(
                 model=self.model,
                 max_tokens=16000,
                 thinking={
@@ -79,63 +238,35 @@ class BriefingGenerator:
                 }]
             )
 
-            # Extract the text content (skip thinking blocks and tool use blocks)
-            # Only include the final text response, not intermediate tool use announcements
-            briefing_content = ""
-            thinking_content = ""
-
-            for block in response.content:
-                if block.type == "thinking":
-                    thinking_content = block.thinking
-                elif block.type == "text":
-                    briefing_content += block.text + "\n"
-                # Skip server_tool_use and web_search_tool_result blocks - these are intermediate steps
-            
-            # Find the start of the actual briefing (should start with "# AI Research Briefing")
-            # This ensures we skip any process narration that might appear before the briefing
-            briefing_start_marker = "# AI Research Briefing"
-            if briefing_start_marker in briefing_content:
-                start_idx = briefing_content.find(briefing_start_marker)
-                briefing_content = briefing_content[start_idx:]
-            
-            # Additional cleanup: remove any remaining process narration patterns
-            lines = briefing_content.split('\n')
-            filtered_lines = []
-            skip_until_heading = False
-            
-            for i, line in enumerate(lines):
-                line_lower = line.lower().strip()
-                
-                # If we find obvious process narration, skip until we hit a heading
-                if any(phrase in line_lower for phrase in [
-                    "research phase", "information gathering", "let me conduct",
-                    "i'll conduct a comprehensive", "let me start by executing"
-                ]):
-                    skip_until_heading = True
-                    continue
-                
-                # If we're skipping, only include headings (they mark the start of real content)
-                if skip_until_heading:
-                    if line.strip().startswith('#'):
-                        skip_until_heading = False
-                        filtered_lines.append(line)
-                    continue
-                
-                # Skip other obvious process narration lines (but keep headings)
-                if any(phrase in line_lower for phrase in [
-                    "let me search", "i'll search", "now let me", "let me fetch",
-                    "executing searches", "searching for", "let me look"
-                ]) and not line.strip().startswith('#'):
-                    continue
-                
-                filtered_lines.append(line)
+            with span("postprocess"):
+                content = self.read_response(response)
+                briefing_content = content["text"]
+                thinking_content = content["thinking"]
+                citations = content["citations"]
+                usage = content["usage"]
+
+                # Find the start of the actual briefing (should start with "# AI Research Briefing")
+                # This ensures we skip any process narration that might appear before the briefing
+                briefing_start_marker = "# AI Research Briefing"
+                if briefing_start_marker in briefing_content:
+                    start_idx = briefing_content.find(briefing_start_marker)
+                    briefing_content = briefing_content[start_idx:]
             
-            briefing_content = '\n'.join(filtered_lines).strip()
+                # Additional cleanup: remove any remaining process narration patterns
+                briefing_content, narration_filtered = self.filter_narration(briefing_content)
+
+                # Check links and dates against what search actually returned
+                link_audit = audit_links(briefing_content, citations, now)
 
             return {
                 "date": today,
+                "date_iso": now.strftime("%Y-%m-%d"),
                 "briefing": briefing_content,
                 "thinking_summary": thinking_content[:500] if thinking_content else None,
+                "narration_filtered": narration_filtered,
+                "usage": usage,
+                "citations": citations,
+                "link_audit": link_audit,
                 "model": self.model,
                 "timestamp": datetime.now().isoformat()
             }
@@ -0,0 +1,228 @@
+import re
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+URL_PATTERN = re.compile(r"https?://[^\s<>()\[\]\"'`]+")
+
+# Bold text that ends with a colon is a field label ("**Link:**"), not a title
+TITLE_LINE_PATTERN = re.compile(r"^\s*\*\*(?P<title>.+?)\*\*\s*$")
+BULLET_PATTERN = re.compile(r"^\s*[-*]\s+")
+BULLET_TITLE_PATTERN = re.compile(r"^\s*[-*]\s+\*\*(?P<title>.+?)\*\*")
+LINK_TEXT_PATTERN = re.compile(r"\[(?P<text>[^\]]+)\]\(https?://")
+SCORE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*/\s*10")
+
+TIERS = {
+    "high priority": "high",
+    "medium priority": "medium",
+    "on the radar": "radar",
+    "notable developments": "radar",
+}
+
+
+def extract_urls(text: str) -> List[str]:
+    """
+    Extract every http(s) URL from a block of markdown, in order of appearance.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        List of unique URLs with trailing punctuation stripped
+    """
+    urls = []
+    for match in URL_PATTERN.finditer(text):
+        url = match.group(0).rstrip(".,;:!?*_")
+        if url not in urls:
+            urls.append(url)
+    return urls
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for deduplication (case, www., trailing slash, tracking params)."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query)
+        if not key.lower().startswith("utm_")
+    ])
+    return urlunsplit(("https", host, parts.path.rstrip("/"), query, ""))
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a title for deduplication (case, punctuation, whitespace)."""
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", title.lower()).split())
+
+
+def _is_field_label(title: str) -> bool:
+    return title.rstrip().endswith(":")
+
+
+def _field_value(line: str, label: str) -> Optional[str]:
+    """Return the text after a "**Label:**" bullet, or None if the line is another field."""
+    match = re.match(rf"^\s*[-*]\s+\*\*{label}:?\*\*:?\s*(.*)$", line, re.IGNORECASE)
+    if match:
+        return match.group(1).strip()
+    return None
+
+
+def _clean_title(title: str) -> str:
+    title = title.strip()
+    link_match = re.match(r"^\[(.+?)\]\(.*\)$", title)
+    if link_match:
+        title = link_match.group(1)
+    return title.strip("[]").strip()
+
+
+def _build_item(lines: List[str], start: int, end: int, title: str,
+                section: Optional[str], tier: Optional[str]) -> Dict[str, Any]:
+    block = lines[start:end]
+    urls = extract_urls("\n".join(block))
+
+    url = None
+    score = None
+    published = None
+    for line in block:
+        link_value = _field_value(line, "Link")
+        if link_value is not None and url is None:
+            link_urls = extract_urls(link_value)
+            url = link_urls[0] if link_urls else None
+        score_value = _field_value(line, "Score")
+        if score_value is not None and score is None:
+            score_match = SCORE_PATTERN.search(score_value)
+            if score_match:
+                score = float(score_match.group(1))
+        published_value = _field_value(line, "Published")
+        if published_value is not None and published is None:
+            published = published_value
+
+    if url is None and urls:
+        url = urls[0]
+
+    return {
+        "title": _clean_title(title),
+        "url": url,
+        "urls": urls,
+        "score": score,
+        "published": published,
+        "section": section,
+        "tier": tier,
+        "start": start,
+        "end": end,
+    }
+
+
+def parse_items(briefing: str) -> List[Dict[str, Any]]:
+    """
+    Split a briefing into its individual items.
+
+    Two item shapes are recognised, matching the output format in prompt.md:
+    a bold title line followed by "- **Field:** value" bullets, and a single
+    "- **Title** (link) - summary" bullet. Any other bullet that carries a
+    URL (e.g. "Further Reading") is also returned so every link belongs to
+    an item.
+
+    Args:
+        briefing: Briefing markdown
+
+    Returns:
+        List of item dicts with title, url, urls, score, published, section
+        ("24h", "week" or None), tier ("high", "medium", "radar" or None)
+        and the [start, end) line range the item occupies
+    """
+    lines = briefing.split("\n")
+    items = []
+    section = None
+    tier = None
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if stripped.startswith("#"):
+            heading = stripped.lstrip("#").strip().lower()
+            if stripped.startswith("###"):
+                tier = next((value for key, value in TIERS.items() if key in heading), None)
+            else:
+                if "last 24 hours" in heading:
+                    section = "24h"
+                elif "last week" in heading:
+                    section = "week"
+                else:
+                    section = None
+                tier = None
+            i += 1
+            continue
+
+        title_match = TITLE_LINE_PATTERN.match(line)
+        if title_match and not _is_field_label(title_match.group("title")):
+            # Block item: consume the field bullets (and blank lines between them)
+            end = i + 1
+            j = i + 1
+            while j < len(lines):
+                candidate = lines[j]
+                if not candidate.strip():
+                    j += 1
+                    continue
+                bullet_title = BULLET_TITLE_PATTERN.match(candidate)
+                if BULLET_PATTERN.match(candidate) and not (
+                    bullet_title and not _is_field_label(bullet_title.group("title"))
+                ):
+                    j += 1
+                    end = j
+                    continue
+                break
+            items.append(_build_item(lines, i, end, title_match.group("title"), section, tier))
+            i = end
+            continue
+
+        if BULLET_PATTERN.match(line) and URL_PATTERN.search(line):
+            bullet_title = BULLET_TITLE_PATTERN.match(line)
+            if bullet_title:
+                title = bullet_title.group("title")
+            else:
+                link_text = LINK_TEXT_PATTERN.search(line)
+                title = link_text.group("text") if link_text else BULLET_PATTERN.sub("", line)
+            items.append(_build_item(lines, i, i + 1, title, section, tier))
+
+        i += 1
+
+    return items
+
+
+def flag_items(briefing: str, flagged: List[Tuple[Dict[str, Any], str]], mode: str = "annotate") -> str:
+    """
+    Annotate or drop items in a briefing.
+
+    Args:
+        briefing: Briefing markdown the items were parsed from
+        flagged: (item, note) pairs, items as returned by parse_items
+        mode: "annotate" to append a warning note to the item's link line
+            (or its title if it has none), "drop" to remove the item
+
+    Returns:
+        Updated briefing markdown
+    """
+    lines = briefing.split("\n")
+    notes = {}
+    for item, note in flagged:
+        notes.setdefault(item["start"], (item, []))[1].append(note)
+
+    # Work bottom-up so earlier line ranges stay valid after drops
+    for start in sorted(notes, reverse=True):
+        item, item_notes = notes[start]
+        if mode == "drop":
+            del lines[item["start"]:item["end"]]
+            continue
+
+        target = item["start"]
+        for index in range(item["start"], item["end"]):
+            if "**link" in lines[index].lower():
+                target = index
+                break
+        lines[target] += "".join(f" ⚠️ *{note}*" for note in item_notes)
+
+    return "\n".join(lines)
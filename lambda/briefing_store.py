@@ -0,0 +1,129 @@
+import os
+import json
+from datetime import date, timedelta
+from typing import Dict, Any, List, Optional
+import boto3
+
+
+class BriefingStore:
+    """Persists generated briefings as JSON in S3 or a local directory."""
+
+    def __init__(self, bucket: str = None, directory: str = None):
+        self.bucket = bucket or os.environ.get("BRIEFING_BUCKET")
+        self.directory = directory or os.environ.get("BRIEFING_ARCHIVE_DIR")
+        self._s3 = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.bucket or self.directory)
+
+    @property
+    def s3(self):
+        if self._s3 is None:
+            self._s3 = boto3.client('s3')
+        return self._s3
+
+    @staticmethod
+    def date_key(briefing_data: Dict[str, Any]) -> str:
+        """Return the ISO date (YYYY-MM-DD) a briefing is stored under."""
+        return briefing_data.get("date_iso") or briefing_data["timestamp"][:10]
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.bucket:
+            try:
+                response = self.s3.get_object(Bucket=self.bucket, Key=key)
+            except self.s3.exceptions.NoSuchKey:
+                return None
+            return json.loads(response['Body'].read())
+
+        try:
+            with open(os.path.join(self.directory, key), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, data: Dict[str, Any]) -> None:
+        body = json.dumps(data, indent=2)
+        if self.bucket:
+            self.s3.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=body.encode('utf-8'),
+                ContentType='application/json'
+            )
+            return
+
+        path = os.path.join(self.directory, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(body)
+
+    def _list(self, prefix: str) -> List[str]:
+        if self.bucket:
+            keys = []
+            paginator = self.s3.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+                keys.extend(obj['Key'] for obj in page.get('Contents', []))
+            return keys
+
+        directory = os.path.join(self.directory, prefix)
+        if not os.path.isdir(directory):
+            return []
+        return [prefix + name for name in os.listdir(directory)]
+
+    def save(self, briefing_data: Dict[str, Any]) -> str:
+        """
+        Store a briefing, replacing any earlier one for the same date.
+
+        Args:
+            briefing_data: Output of BriefingGenerator.generate_briefing
+
+        Returns:
+            The key the briefing was stored under
+        """
+        key = f"briefings/{self.date_key(briefing_data)}.json"
+        self._write(key, briefing_data)
+        return key
+
+    def load(self, date_iso: str) -> Optional[Dict[str, Any]]:
+        """Load the briefing stored for a date, or None if there isn't one."""
+        return self._read(f"briefings/{date_iso}.json")
+
+    def list_dates(self) -> List[str]:
+        """Return the ISO dates of all stored briefings, oldest first."""
+        return sorted(
+            key[len("briefings/"):-len(".json")]
+            for key in self._list("briefings/")
+            if key.endswith(".json")
+        )
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Load the most recent stored briefing."""
+        dates = self.list_dates()
+        return self.load(dates[-1]) if dates else None
+
+    def load_range(self, start: date, end: date) -> List[Dict[str, Any]]:
+        """
+        Load the stored briefings between two dates, inclusive.
+
+        Missing days are skipped.
+
+        Returns:
+            List of briefing dicts, oldest first
+        """
+        briefings = []
+        day = start
+        while day <= end:
+            briefing_data = self.load(day.isoformat())
+            if briefing_data is not None:
+                briefings.append(briefing_data)
+            day += timedelta(days=1)
+        return briefings
+
+    def load_state(self, name: str) -> Optional[Dict[str, Any]]:
+        """Load a named piece of state kept between runs (e.g. a running digest)."""
+        return self._read(f"state/{name}.json")
+
+    def save_state(self, name: str, state: Dict[str, Any]) -> None:
+        """Store a named piece of state for the next run."""
+        self._write(f"state/{name}.json", state)
@@ -0,0 +1,187 @@
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+from briefing_items import flag_items, normalize_url, parse_items
+
+
+# Days back from the briefing date each section may reach; one day of slack
+# on top of the prompt's windows absorbs day-granular dates and time zones
+SECTION_WINDOWS = {"24h": 2, "week": 8}
+
+DATE_FORMATS = ["%B %d, %Y", "%b %d, %Y", "%B %d %Y", "%b %d %Y", "%Y-%m-%d", "%d %B %Y", "%d %b %Y"]
+DATE_PREFIX_PATTERN = re.compile(r"[A-Za-z]+\.? \d{1,2},? \d{4}|\d{4}-\d{2}-\d{2}|\d{1,2} [A-Za-z]+ \d{4}")
+RELATIVE_AGE_PATTERN = re.compile(r"(\d+)\s+(minute|hour|day|week|month)s?\s+ago", re.IGNORECASE)
+RELATIVE_UNITS = {"minute": 1 / 1440, "hour": 1 / 24, "day": 1, "week": 7, "month": 30}
+
+
+def extract_citations(content: List[Any]) -> Dict[str, Any]:
+    """
+    Build a compact citation table from a response's server tool blocks.
+
+    Collects the queries from server_tool_use blocks, every result (URL,
+    title, page age) from web_search_tool_result blocks, and marks the
+    results that text blocks cite directly.
+
+    Args:
+        content: The response's content blocks
+
+    Returns:
+        Dict with "queries" (list of search strings) and "results" (list of
+        dicts with url, title, page_age and cited)
+    """
+    queries = []
+    results = {}
+    cited = set()
+
+    for block in content:
+        block_type = getattr(block, "type", None)
+        if block_type == "server_tool_use":
+            query = (getattr(block, "input", None) or {})
+            query = query.get("query") if isinstance(query, dict) else getattr(query, "query", None)
+            if query:
+                queries.append(query)
+        elif block_type == "web_search_tool_result":
+            block_content = getattr(block, "content", None)
+            # An error result is a single object rather than a list of results
+            if not isinstance(block_content, list):
+                continue
+            for result in block_content:
+                url = getattr(result, "url", None)
+                if not url:
+                    continue
+                results.setdefault(normalize_url(url), {
+                    "url": url,
+                    "title": getattr(result, "title", None),
+                    "page_age": getattr(result, "page_age", None),
+                    "cited": False,
+                })
+        elif block_type == "text":
+            block_citations = getattr(block, "citations", None)
+            if isinstance(block_citations, list):
+                for citation in block_citations:
+                    url = getattr(citation, "url", None)
+                    if url:
+                        cited.add(normalize_url(url))
+
+    for key in cited:
+        if key in results:
+            results[key]["cited"] = True
+
+    return {"queries": queries, "results": list(results.values())}
+
+
+def parse_page_age(page_age: Optional[str], reference: datetime) -> Optional[datetime]:
+    """
+    Parse a search result's page age ("January 12, 2026", "3 days ago", ...).
+
+    Args:
+        page_age: Page age string from the search result or briefing
+        reference: When the briefing was written, for relative ages
+
+    Returns:
+        The publication datetime, or None if it can't be parsed
+    """
+    if not page_age:
+        return None
+    text = page_age.strip()
+
+    relative = RELATIVE_AGE_PATTERN.search(text)
+    if relative:
+        days = int(relative.group(1)) * RELATIVE_UNITS[relative.group(2).lower()]
+        return reference - timedelta(days=days)
+    if text.lower().startswith("yesterday"):
+        return reference - timedelta(days=1)
+    if text.lower().startswith("today"):
+        return reference
+
+    # Drop times and weekday prefixes ("Mon, January 12, 2026 10:00 AM")
+    text = re.sub(r"^[A-Za-z]{3,9},\s+(?=[A-Za-z])", "", text)
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        pass
+    date_match = DATE_PREFIX_PATTERN.match(text)
+    candidate = date_match.group(0).replace(".", "") if date_match else text
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(candidate, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def audit_links(briefing: str, citations: Dict[str, Any], reference: datetime) -> List[Dict[str, Any]]:
+    """
+    Join the briefing's items against the citation table.
+
+    Every item from the "Last 24 Hours" and "Last Week" sections is checked
+    for whether its link was actually returned by search, and its date (the
+    search result's page age, falling back to the briefing's "Published"
+    field) against its section's window.
+
+    Args:
+        briefing: Briefing markdown
+        citations: Output of extract_citations
+        reference: When the briefing was written
+
+    Returns:
+        List of findings with title, url, section, retrieved, page_age,
+        published (ISO date or None) and in_window (None when undated)
+    """
+    table = {normalize_url(result["url"]): result for result in citations["results"]}
+    findings = []
+    for item in parse_items(briefing):
+        if item["section"] not in SECTION_WINDOWS or item["url"] is None:
+            continue
+
+        result = table.get(normalize_url(item["url"]))
+        page_age = result["page_age"] if result else None
+        published = parse_page_age(page_age, reference) or parse_page_age(item["published"], reference)
+
+        in_window = None
+        if published is not None:
+            age_days = (reference.date() - published.date()).days
+            in_window = -1 <= age_days <= SECTION_WINDOWS[item["section"]]
+
+        findings.append({
+            "title": item["title"],
+            "url": item["url"],
+            "section": item["section"],
+            "retrieved": result is not None,
+            "page_age": page_age,
+            "published": published.date().isoformat() if published else None,
+            "in_window": in_window,
+        })
+    return findings
+
+
+def apply_citation_audit(briefing_data: Dict[str, Any], mode: str = None) -> Dict[str, Any]:
+    """
+    Flag items whose link search never returned, or whose date is out of window.
+
+    Args:
+        briefing_data: Output of BriefingGenerator.generate_briefing, updated in place
+        mode: "annotate", "drop" or "off" (defaults to CITATION_CHECK_MODE, then "annotate")
+
+    Returns:
+        The same briefing_data dict with "briefing" updated
+    """
+    mode = mode or os.environ.get("CITATION_CHECK_MODE", "annotate")
+    findings = briefing_data.get("link_audit")
+    if mode == "off" or not findings:
+        return briefing_data
+
+    by_url = {finding["url"]: finding for finding in findings}
+    flagged = []
+    for item in parse_items(briefing_data["briefing"]):
+        finding = by_url.get(item["url"])
+        if finding is None or item["section"] != finding["section"]:
+            continue
+        if finding["in_window"] is False:
+            flagged.append((item, f"Published {finding['published']}, outside this section's window"))
+        elif not finding["retrieved"]:
+            flagged.append((item, "Link not found in this run's search results"))
+
+    briefing_data["briefing"] = flag_items(briefing_data["briefing"], flagged, mode)
+    return briefing_data
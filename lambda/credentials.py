@@ -0,0 +1,93 @@
+import os
+import json
+import time
+from typing import Dict, Any, Callable, Optional, Tuple
+import boto3
+
+
+DEFAULT_CACHE_TTL = 300
+
+# Module-level so values survive warm Lambda invocations
+_cache: Dict[str, Tuple[float, Any]] = {}
+_clients: Dict[str, Any] = {}
+
+
+def _client(service: str) -> Any:
+    if service not in _clients:
+        _clients[service] = boto3.client(service)
+    return _clients[service]
+
+
+def _cached(key: str, fetch: Callable[[], Any]) -> Any:
+    """Return a cached value, refetching it once the TTL has passed."""
+    ttl = float(os.environ.get("CREDENTIAL_CACHE_TTL", DEFAULT_CACHE_TTL))
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+
+    value = fetch()
+    _cache[key] = (now, value)
+    return value
+
+
+def clear_cache() -> None:
+    """Forget cached values and clients, e.g. right after rotating a secret."""
+    _cache.clear()
+    _clients.clear()
+
+
+def _fetch_secret(secret_id: str) -> str:
+    response = _client('secretsmanager').get_secret_value(SecretId=secret_id)
+    secret = response['SecretString']
+    # Accept either the raw key or a JSON secret with an ANTHROPIC_API_KEY field
+    try:
+        parsed = json.loads(secret)
+    except json.JSONDecodeError:
+        return secret
+    if isinstance(parsed, dict):
+        return parsed["ANTHROPIC_API_KEY"]
+    return secret
+
+
+def _fetch_parameter(name: str) -> str:
+    response = _client('ssm').get_parameter(Name=name, WithDecryption=True)
+    return response['Parameter']['Value']
+
+
+def get_anthropic_api_key() -> Optional[str]:
+    """
+    Resolve the Anthropic API key.
+
+    Read from the Secrets Manager secret named by ANTHROPIC_SECRET_ID when
+    set, otherwise from the ANTHROPIC_API_KEY environment variable (local
+    development and tests).
+
+    Returns:
+        The API key, or None if it isn't configured
+    """
+    secret_id = os.environ.get("ANTHROPIC_SECRET_ID")
+    if secret_id:
+        return _cached(f"secret:{secret_id}", lambda: _fetch_secret(secret_id))
+    return os.environ.get("ANTHROPIC_API_KEY")
+
+
+def _get_setting(name: str) -> Optional[str]:
+    parameter_name = os.environ.get(f"{name}_PARAM")
+    if parameter_name:
+        return _cached(f"ssm:{parameter_name}", lambda: _fetch_parameter(parameter_name))
+    return os.environ.get(name)
+
+
+def get_email_config() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Resolve the sender and recipient addresses.
+
+    Each is read from the SSM parameter named by SENDER_EMAIL_PARAM /
+    RECIPIENT_EMAIL_PARAM when set, otherwise from SENDER_EMAIL /
+    RECIPIENT_EMAIL.
+
+    Returns:
+        Tuple of (sender_email, recipient_email); either may be None
+    """
+    return _get_setting("SENDER_EMAIL"), _get_setting("RECIPIENT_EMAIL")
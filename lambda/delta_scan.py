@@ -0,0 +1,222 @@
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+from briefing_generator import estimate_cost
+from briefing_items import normalize_title, normalize_url, parse_items
+from citations import apply_citation_audit, audit_links
+from tracing import span
+
+
+DELTA_MODEL = "claude-haiku-4-5-20251001"
+DELTA_PROMPT_FILE = os.path.join(os.path.dirname(__file__), "delta_prompt.md")
+NO_NEW_ITEMS = "NO_NEW_ITEMS"
+ALERT_SCORE = 9
+
+STATE_NAME = "delta_scan"
+# Alerted items stay in the covered context this long so they aren't re-sent
+ALERTED_RETENTION = timedelta(hours=48)
+# Enough run records for a week of hourly scans
+HISTORY_LENGTH = 168
+
+DEFAULT_MAX_SEARCHES = 3
+DEFAULT_COST_TARGET = 0.05
+DEFAULT_LATENCY_TARGET = 60.0
+
+
+def covered_items(latest: Optional[Dict[str, Any]], alerted: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    List what the reader has already seen: the latest briefing's items plus earlier alerts.
+
+    Args:
+        latest: Most recent stored daily briefing, or None
+        alerted: Items sent in earlier alerts
+
+    Returns:
+        List of dicts with title and url, deduplicated
+    """
+    items = parse_items(latest["briefing"]) if latest else []
+    covered = []
+    seen = set()
+    for item in items + alerted:
+        key = normalize_url(item["url"]) if item.get("url") else normalize_title(item["title"])
+        if key in seen:
+            continue
+        seen.add(key)
+        covered.append({"title": item["title"], "url": item.get("url")})
+    return covered
+
+
+def format_covered(covered: List[Dict[str, Any]]) -> str:
+    """Render covered items as a compact bullet list for the prompt."""
+    if not covered:
+        return "- (nothing yet)"
+    return "\n".join(f"- {item['title']}" + (f" ({item['url']})" if item["url"] else "") for item in covered)
+
+
+def select_alert_items(text: str, covered: List[Dict[str, Any]],
+                       link_audit: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Pick the items worth an alert from the scan's output.
+
+    Args:
+        text: Markdown returned by the scan
+        covered: Items the reader has already seen
+        link_audit: The scan's findings from citations.audit_links
+
+    Returns:
+        Items scoring ALERT_SCORE or above, with a link this scan's search
+        actually returned, that aren't already covered
+    """
+    if text.strip() == NO_NEW_ITEMS:
+        return []
+
+    covered_keys = set()
+    for item in covered:
+        covered_keys.add(normalize_title(item["title"]))
+        if item["url"]:
+            covered_keys.add(normalize_url(item["url"]))
+
+    retrieved = {finding["url"] for finding in link_audit if finding["retrieved"]}
+
+    selected = []
+    for item in parse_items(text):
+        if item["score"] is None or item["score"] < ALERT_SCORE:
+            continue
+        # audit_links skips items without a link, so they must be rejected here
+        if item["url"] is None or item["url"] not in retrieved:
+            continue
+        if normalize_title(item["title"]) in covered_keys:
+            continue
+        if normalize_url(item["url"]) in covered_keys:
+            continue
+        selected.append(item)
+    return selected
+
+
+def run_delta_scan(generator: Any, store: Any, now: datetime = None) -> Dict[str, Any]:
+    """
+    Look for new high-priority developments since the last scan.
+
+    One small model call is made: a handful of searches, no extended
+    thinking, and the items already sent today as covered context. Items
+    that search never returned or that fall outside the last day are
+    dropped rather than alerted on. The run's cost and latency are
+    compared against DELTA_COST_TARGET_USD and DELTA_LATENCY_TARGET_SECONDS,
+    exported as metrics and kept in the store's run history.
+
+    Args:
+        generator: BriefingGenerator loaded with delta_prompt.md
+        store: BriefingStore holding the daily briefings and scan state
+        now: Time of the scan (defaults to now)
+
+    Returns:
+        Dict shaped like generate_briefing's output, ready for send_email,
+        plus "alert" (whether anything qualified), "alert_items" and "metrics"
+    """
+    now = now or datetime.now()
+    start = time.perf_counter()
+    model = os.environ.get("DELTA_MODEL", DELTA_MODEL)
+
+    with span("delta_scan", model=model) as scan_span:
+        state = store.load_state(STATE_NAME) or {}
+        latest = store.latest()
+        alerted = [
+            item for item in state.get("alerted", [])
+            if now - datetime.fromisoformat(item["timestamp"]) <= ALERTED_RETENTION
+        ]
+        covered = covered_items(latest, alerted)
+
+        # Since whichever came last: the previous scan, or the latest briefing
+        # (whose items are covered), so the first scan of a day starts from
+        # the morning briefing rather than last evening's scan
+        candidates = [
+            datetime.fromisoformat(timestamp)
+            for timestamp in (state.get("last_run"), (latest or {}).get("timestamp")) if timestamp
+        ]
+        since = max(candidates) if candidates else None
+        if since is None or now - since > timedelta(days=1):
+            since = now - timedelta(hours=1)
+
+        prompt = generator.load_prompt_template().format(
+            now=now.strftime("%B %d, %Y %H:%M"),
+            since=since.strftime("%B %d, %Y %H:%M"),
+            covered=format_covered(covered),
+        )
+        response = generator.create_message(
+            model=model,
+            max_tokens=2048,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }],
+            tools=[{
+                "type": "web_search_20250305",
+                "name": "web_search",
+                "max_uses": int(os.environ.get("DELTA_MAX_SEARCHES", DEFAULT_MAX_SEARCHES))
+            }]
+        )
+
+        content = generator.read_response(response)
+        text, _ = generator.filter_narration(content["text"])
+        scan_data = {"briefing": text, "link_audit": audit_links(text, content["citations"], now)}
+        # An alert interrupts the reader's day, so anything unverifiable is dropped, not flagged
+        apply_citation_audit(scan_data, mode="drop")
+        items = select_alert_items(scan_data["briefing"], covered, scan_data["link_audit"])
+
+        usage = content["usage"]
+        cost = estimate_cost(model, usage)
+        latency = time.perf_counter() - start
+        daily_cost = estimate_cost(latest["model"], latest["usage"]) if latest and "usage" in latest else None
+        metrics = {
+            "cost_usd": round(cost, 4),
+            "latency_seconds": round(latency, 3),
+            "cost_target_usd": float(os.environ.get("DELTA_COST_TARGET_USD", DEFAULT_COST_TARGET)),
+            "latency_target_seconds": float(os.environ.get("DELTA_LATENCY_TARGET_SECONDS", DEFAULT_LATENCY_TARGET)),
+            "daily_cost_usd": round(daily_cost, 4) if daily_cost is not None else None,
+            "fraction_of_daily": round(cost / daily_cost, 3) if daily_cost else None,
+        }
+        metrics["within_target"] = (
+            metrics["cost_usd"] <= metrics["cost_target_usd"]
+            and metrics["latency_seconds"] <= metrics["latency_target_seconds"]
+        )
+
+        scan_span.set("alert_items", len(items))
+        scan_span.metric("RunCost", metrics["cost_usd"])
+        scan_span.metric("WithinTarget", int(metrics["within_target"]), "Count")
+        scan_span.metric("WebSearchRequests", usage["web_search_requests"], "Count")
+        if not metrics["within_target"]:
+            print(f"Delta scan over target: {metrics}")
+
+        state["last_run"] = now.isoformat()
+        state["alerted"] = alerted + [
+            {"title": item["title"], "url": item["url"], "timestamp": now.isoformat()} for item in items
+        ]
+        state["runs"] = (state.get("runs", []) + [{
+            "timestamp": now.isoformat(),
+            "alerts": len(items),
+            "cost_usd": metrics["cost_usd"],
+            "latency_seconds": metrics["latency_seconds"],
+            "web_search_requests": usage["web_search_requests"],
+        }])[-HISTORY_LENGTH:]
+        store.save_state(STATE_NAME, state)
+
+    lines = scan_data["briefing"].split("\n")
+    date = now.strftime("%B %d, %Y %H:%M")
+    alert_markdown = [f"# AI Research Alert - {date}", ""]
+    for item in items:
+        alert_markdown.extend(lines[item["start"]:item["end"]])
+        alert_markdown.append("")
+
+    return {
+        "title": "AI Research Alert",
+        "date": date,
+        "date_iso": now.strftime("%Y-%m-%d"),
+        "briefing": "\n".join(alert_markdown).strip(),
+        "alert": bool(items),
+        "alert_items": [{"title": item["title"], "url": item["url"], "score": item["score"]} for item in items],
+        "usage": usage,
+        "metrics": metrics,
+        "model": model,
+        "timestamp": datetime.now().isoformat(),
+    }
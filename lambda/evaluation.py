@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Backfill and prompt A/B evaluation runner.
+
+Generates briefings for a date range and/or several prompt variants in
+parallel, without sending email, and reports comparative metrics per variant.
+
+Usage:
+    python lambda/evaluation.py --start 2026-01-05 --end 2026-01-09 \\
+        --variant baseline=lambda/prompt.md --variant terse=prompts/terse.md \\
+        --concurrency 4 --output eval_runs/
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from briefing_generator import BriefingGenerator, estimate_cost
+from briefing_items import extract_urls, parse_items
+
+
+def _request_key(kwargs: Dict[str, Any]) -> str:
+    """Key a request by model and messages, which include the dated prompt."""
+    payload = json.dumps({"model": kwargs.get("model"), "messages": kwargs.get("messages")}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _to_namespace(value: Any) -> Any:
+    if isinstance(value, dict):
+        return SimpleNamespace(**{key: _to_namespace(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [_to_namespace(item) for item in value]
+    return value
+
+
+class RecordingClient:
+    """Wraps an Anthropic client and saves every response for offline replay."""
+
+    def __init__(self, client: Any, directory: str):
+        self.directory = directory
+        self.messages = SimpleNamespace(create=self._create)
+        self._client = client
+        os.makedirs(directory, exist_ok=True)
+
+    def _create(self, **kwargs) -> Any:
+        response = self._client.messages.create(**kwargs)
+        path = os.path.join(self.directory, f"{_request_key(kwargs)}.json")
+        with open(path, 'w') as f:
+            json.dump(response.model_dump(mode="json"), f)
+        return response
+
+
+class RecordedClient:
+    """Offline stand-in for the Anthropic client that replays recorded responses."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, **kwargs) -> Any:
+        path = os.path.join(self.directory, f"{_request_key(kwargs)}.json")
+        try:
+            with open(path, 'r') as f:
+                return _to_namespace(json.load(f))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No recorded response for this request at {path}")
+
+
+def briefing_metrics(briefing_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute comparable quality and cost metrics for one generated briefing.
+
+    Args:
+        briefing_data: Output of BriefingGenerator.generate_briefing
+
+    Returns:
+        Dict with items per tier, link count, citation audit findings, narration-filter
+        hits, tokens and cost
+    """
+    items = [item for item in parse_items(briefing_data["briefing"]) if item["section"] in ("24h", "week")]
+    tiers = {"high": 0, "medium": 0, "radar": 0}
+    for item in items:
+        tiers[item["tier"] or "radar"] += 1
+
+    usage = briefing_data.get("usage", {})
+    link_audit = briefing_data.get("link_audit", [])
+    return {
+        "items": len(items),
+        "items_per_tier": tiers,
+        "links": len(extract_urls(briefing_data["briefing"])),
+        "unretrieved_links": sum(1 for finding in link_audit if not finding["retrieved"]),
+        "out_of_window": sum(1 for finding in link_audit if finding["in_window"] is False),
+        "narration_filtered": briefing_data.get("narration_filtered", 0),
+        "input_tokens": usage.get("input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+        "web_search_requests": usage.get("web_search_requests", 0),
+        "cost_usd": round(estimate_cost(briefing_data["model"], usage), 4),
+    }
+
+
+def run_one(client: Any, variant: str, prompt_file: str, day: datetime, output_dir: str) -> Dict[str, Any]:
+    """Generate one briefing, save it with its usage and latency, and return its run record."""
+    record = {"variant": variant, "date": day.strftime("%Y-%m-%d"), "prompt_file": prompt_file}
+    start = time.monotonic()
+    try:
+        generator = BriefingGenerator(prompt_file=prompt_file, client=client, stream=False)
+        briefing_data = generator.generate_briefing(date=day)
+        record["latency_seconds"] = round(time.monotonic() - start, 3)
+        record["metrics"] = briefing_metrics(briefing_data)
+        briefing_data["latency_seconds"] = record["latency_seconds"]
+    except Exception as e:
+        record["latency_seconds"] = round(time.monotonic() - start, 3)
+        record["error"] = str(e)
+        briefing_data = None
+
+    path = os.path.join(output_dir, variant, f"{record['date']}.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({"run": record, "briefing": briefing_data}, f, indent=2)
+    return record
+
+
+def run_evaluation(client: Any, variants: Dict[str, str], days: List[datetime], output_dir: str,
+                   concurrency: int = 4) -> Dict[str, Any]:
+    """
+    Generate a briefing for every (variant, day) pair with bounded concurrency.
+
+    Args:
+        client: Anthropic client (or RecordedClient for offline runs) shared by all runs
+        variants: Mapping of variant name to prompt file
+        days: Days to generate briefings for
+        output_dir: Directory for per-run outputs and the report
+        concurrency: Maximum number of briefings generated at once
+
+    Returns:
+        Report dict with every run and per-variant aggregates
+    """
+    jobs = [(variant, prompt_file, day) for variant, prompt_file in variants.items() for day in days]
+    lock = threading.Lock()
+    completed = []
+
+    def job(args: Tuple[str, str, datetime]) -> Dict[str, Any]:
+        record = run_one(client, *args, output_dir)
+        with lock:
+            completed.append(record)
+            status = "error" if "error" in record else f"{record['latency_seconds']}s"
+            print(f"[{len(completed)}/{len(jobs)}] {record['variant']} {record['date']}: {status}")
+        return record
+
+    wall_start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        runs = list(executor.map(job, jobs))
+    wall_time = time.monotonic() - wall_start
+
+    report = {
+        "wall_time_seconds": round(wall_time, 3),
+        "runs": runs,
+        "variants": {name: summarize_variant([r for r in runs if r["variant"] == name]) for name in variants},
+    }
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "report.json"), 'w') as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def summarize_variant(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate the runs of one variant into totals and per-run means."""
+    succeeded = [r for r in runs if "error" not in r]
+    count = len(succeeded) or 1
+
+    def total(key: str) -> float:
+        return sum(r["metrics"][key] for r in succeeded)
+
+    return {
+        "runs": len(runs),
+        "errors": len(runs) - len(succeeded),
+        "mean_items_per_tier": {
+            tier: round(sum(r["metrics"]["items_per_tier"][tier] for r in succeeded) / count, 2)
+            for tier in ("high", "medium", "radar")
+        },
+        "mean_links": round(total("links") / count, 2),
+        "unretrieved_links": total("unretrieved_links"),
+        "out_of_window": total("out_of_window"),
+        "narration_filtered": total("narration_filtered"),
+        "input_tokens": total("input_tokens"),
+        "output_tokens": total("output_tokens"),
+        "web_search_requests": total("web_search_requests"),
+        "cost_usd": round(total("cost_usd"), 4),
+        "mean_cost_usd": round(total("cost_usd") / count, 4),
+        "mean_latency_seconds": round(sum(r["latency_seconds"] for r in succeeded) / count, 3),
+        "total_latency_seconds": round(sum(r["latency_seconds"] for r in runs), 3),
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render the per-variant comparison as a plain-text table."""
+    header = (f"{'variant':<16}{'runs':>6}{'err':>5}{'high':>7}{'med':>7}{'radar':>7}"
+              f"{'links':>7}{'narr':>6}{'in tok':>10}{'out tok':>10}{'cost $':>9}{'lat s':>8}")
+    lines = [header, "-" * len(header)]
+    for name, summary in report["variants"].items():
+        tiers = summary["mean_items_per_tier"]
+        lines.append(
+            f"{name:<16}{summary['runs']:>6}{summary['errors']:>5}{tiers['high']:>7}{tiers['medium']:>7}"
+            f"{tiers['radar']:>7}{summary['mean_links']:>7}{summary['narration_filtered']:>6}"
+            f"{summary['input_tokens']:>10}{summary['output_tokens']:>10}{summary['cost_usd']:>9}"
+            f"{summary['mean_latency_seconds']:>8}"
+        )
+    lines.append(f"\nWall time: {report['wall_time_seconds']}s")
+    return "\n".join(lines)
+
+
+def _parse_variant(value: str) -> Tuple[str, str]:
+    if "=" in value:
+        name, path = value.split("=", 1)
+    else:
+        path = value
+        name = os.path.splitext(os.path.basename(value))[0]
+    return name, path
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Backfill briefings and compare prompt variants without sending email")
+    parser.add_argument("--start", help="First day to generate (YYYY-MM-DD, defaults to today)")
+    parser.add_argument("--end", help="Last day to generate (YYYY-MM-DD, defaults to --start)")
+    parser.add_argument("--variant", action="append", default=[],
+                        help="Prompt variant as name=path/to/prompt.md (repeatable, defaults to lambda/prompt.md)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum briefings generated at once")
+    parser.add_argument("--output", default="eval_runs", help="Directory for outputs and report.json")
+    backend = parser.add_mutually_exclusive_group()
+    backend.add_argument("--record", metavar="DIR", help="Save every API response to DIR for offline replay")
+    backend.add_argument("--replay", metavar="DIR", help="Run offline against responses recorded in DIR")
+    args = parser.parse_args(argv)
+
+    today = datetime.combine(date.today(), datetime.min.time())
+    start = datetime.strptime(args.start, "%Y-%m-%d") if args.start else today
+    end = datetime.strptime(args.end, "%Y-%m-%d") if args.end else start
+    if end < start:
+        parser.error(f"--end ({end:%Y-%m-%d}) is before --start ({start:%Y-%m-%d})")
+    days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+    variants = dict(_parse_variant(value) for value in args.variant) or {
+        "baseline": os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompt.md")
+    }
+
+    if args.replay:
+        client = RecordedClient(args.replay)
+    else:
+        client = BriefingGenerator().client
+        if args.record:
+            client = RecordingClient(client, args.record)
+
+    report = run_evaluation(client, variants, days, args.output, args.concurrency)
+    print()
+    print(format_report(report))
+    return 0 if all(summary["errors"] == 0 for summary in report["variants"].values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,19 +1,56 @@
-import os
 import json
 import boto3
-import markdown
 from typing import Dict, Any
 from briefing_generator import BriefingGenerator
+from briefing_store import BriefingStore
+from citations import apply_citation_audit
+from credentials import get_email_config
+from delta_scan import DELTA_PROMPT_FILE, run_delta_scan
+from link_verifier import verify_briefing_links
+from rendering import render_html, render_text
+from tracing import trace, span, profile, profiler_mode
+from weekly_digest import build_weekly_digest, update_weekly_digest
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     AWS Lambda handler for daily briefing generation.
 
+    Every stage is traced and exported when the invocation ends (see
+    tracing.py). Besides "mode", the event may set:
+        "profile": "cprofile" or "tracemalloc" to profile this invocation
+        "stream": true to stream the model response and record time to first token
+
     Args:
-        event: Lambda event object
+        event: Lambda event object; {"mode": "weekly_digest"} builds the
+            weekly digest from stored briefings instead of a daily briefing,
+            {"mode": "delta"} runs an intraday scan that only emails alerts
         context: Lambda context object
 
+    Returns:
+        Response dictionary with status and details
+    """
+    mode = event.get("mode", "daily")
+    with trace(mode=mode, request_id=getattr(context, "aws_request_id", None)):
+        with profile(profiler_mode(event)):
+            with span("handler") as handler_span:
+                if mode == "weekly_digest":
+                    response = handle_weekly_digest(event)
+                elif mode == "delta":
+                    response = handle_delta_scan(event)
+                else:
+                    response = handle_daily_briefing(event)
+                handler_span.set("status_code", response["statusCode"])
+                return response
+
+
+def handle_daily_briefing(event: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate, check, archive and send the daily briefing.
+
+    Args:
+        event: Lambda event object
+
     Returns:
         Response dictionary with status and details
     """
@@ -22,11 +59,31 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
     try:
         # Generate the briefing
-        generator = BriefingGenerator()
-        briefing_data = generator.generate_briefing()
+        with span("generate"):
+            generator = BriefingGenerator(stream=event.get("stream"))
+            briefing_data = generator.generate_briefing()
 
         print(f"Briefing generated successfully for {briefing_data['date']}")
 
+        # Check every link and date before it reaches the inbox; a failed check never blocks delivery
+        with span("link_check"):
+            try:
+                apply_citation_audit(briefing_data)
+                verify_briefing_links(briefing_data)
+                print(f"Link check complete: {briefing_data.get('link_check')}")
+            except Exception as link_error:
+                print(f"Link check skipped: {str(link_error)}")
+
+        # Archive the briefing for the weekly digest; a storage failure never blocks delivery
+        store = BriefingStore()
+        if store.enabled:
+            with span("store"):
+                try:
+                    print(f"Briefing stored at {store.save(briefing_data)}")
+                    update_weekly_digest(store, briefing_data)
+                except Exception as store_error:
+                    print(f"Failed to store briefing: {str(store_error)}")
+
         # Send email with the briefing
         email_result = send_email(briefing_data)
 
@@ -60,164 +117,167 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
 
 
-def send_email(briefing_data: Dict[str, Any]) -> Dict[str, bool]:
+def handle_weekly_digest(event: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Send the daily briefing via AWS SES.
+    Build and send the weekly digest from the stored daily briefings.
+
+    No web research is done; at most one small summarization call is made,
+    and it is skipped when the event sets "summarize" to false.
 
     Args:
-        briefing_data: Dictionary containing briefing content and metadata
+        event: Lambda event object
 
     Returns:
-        Dictionary with success status
+        Response dictionary with status and details
     """
-    ses_client = boto3.client('ses')
+    print(f"Starting weekly digest")
+    print(f"Event: {json.dumps(event)}")
 
-    recipient_email = os.environ.get("RECIPIENT_EMAIL")
-    sender_email = os.environ.get("SENDER_EMAIL")
+    try:
+        store = BriefingStore()
+        if not store.enabled:
+            raise ValueError("BRIEFING_BUCKET or BRIEFING_ARCHIVE_DIR environment variable is required")
 
-    if not recipient_email or not sender_email:
-        raise ValueError("RECIPIENT_EMAIL and SENDER_EMAIL environment variables are required")
+        client = BriefingGenerator().client if event.get("summarize", True) else None
+        with span("weekly_digest"):
+            digest_data = build_weekly_digest(store, client=client)
 
-    subject = f"Daily Briefing - {briefing_data['date']}"
+        print(f"Digest built from {len(digest_data['source_dates'])} briefings "
+              f"with {digest_data['item_count']} items")
 
-    # Convert markdown to HTML
-    briefing_html = markdown.markdown(
-        briefing_data['briefing'],
-        extensions=['tables', 'fenced_code', 'nl2br']
-    )
+        email_result = send_email(digest_data)
+
+        print(f"Email sent successfully: {email_result}")
 
-    # Create HTML email body
-    html_body = f"""
-    <html>
-    <head>
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 800px;
-                margin: 0 auto;
-                padding: 20px;
-            }}
-            .header {{
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                color: white;
-                padding: 30px;
-                border-radius: 10px 10px 0 0;
-                text-align: center;
-            }}
-            .content {{
-                background: #f9f9f9;
-                padding: 30px;
-                border-radius: 0 0 10px 10px;
-            }}
-            .content h1, .content h2, .content h3 {{
-                color: #444;
-                margin-top: 1.5em;
-                margin-bottom: 0.5em;
-            }}
-            .content h1:first-child, .content h2:first-child, .content h3:first-child {{
-                margin-top: 0;
-            }}
-            .content ul, .content ol {{
-                margin: 1em 0;
-                padding-left: 2em;
-            }}
-            .content li {{
-                margin: 0.5em 0;
-            }}
-            .content p {{
-                margin: 1em 0;
-            }}
-            .content code {{
-                background: #e8e8e8;
-                padding: 2px 6px;
-                border-radius: 3px;
-                font-family: monospace;
-            }}
-            .content pre {{
-                background: #e8e8e8;
-                padding: 15px;
-                border-radius: 5px;
-                overflow-x: auto;
-            }}
-            .content blockquote {{
-                border-left: 4px solid #667eea;
-                margin: 1em 0;
-                padding-left: 1em;
-                color: #666;
-            }}
-            .content table {{
-                border-collapse: collapse;
-                width: 100%;
-                margin: 1em 0;
-            }}
-            .content th, .content td {{
-                border: 1px solid #ddd;
-                padding: 8px;
-                text-align: left;
-            }}
-            .content th {{
-                background: #f0f0f0;
-            }}
-            .footer {{
-                margin-top: 20px;
-                padding: 20px;
-                text-align: center;
-                color: #666;
-                font-size: 12px;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>Your Daily Briefing</h1>
-            <p>{briefing_data['date']}</p>
-        </div>
-        <div class="content">
-            {briefing_html}
-        </div>
-        <div class="footer">
-            <p>Generated by Claude {briefing_data['model']}</p>
-            <p>Timestamp: {briefing_data['timestamp']}</p>
-        </div>
-    </body>
-    </html>
+        return {
+            "statusCode": 200,
+            "body": json.dumps({
+                "message": "Weekly digest generated and sent successfully",
+                "date": digest_data["date"],
+                "items": digest_data["item_count"],
+                "email_sent": email_result["success"]
+            })
+        }
+
+    except Exception as e:
+        error_msg = f"Error generating weekly digest: {str(e)}"
+        print(error_msg)
+
+        try:
+            send_error_notification(error_msg)
+        except Exception as email_error:
+            print(f"Failed to send error notification: {str(email_error)}")
+
+        return {
+            "statusCode": 500,
+            "body": json.dumps({
+                "message": "Failed to generate weekly digest",
+                "error": str(e)
+            })
+        }
+
+
+def handle_delta_scan(event: Dict[str, Any]) -> Dict[str, Any]:
     """
+    Scan for new high-priority developments since the last run and email only if one turns up.
 
-    # Plain text version
-    text_body = f"""
-Daily Briefing - {briefing_data['date']}
+    Args:
+        event: Lambda event object
 
-{briefing_data['briefing']}
+    Returns:
+        Response dictionary with status, whether an alert was sent, and the run's cost metrics
+    """
+    print(f"Starting delta scan")
+    print(f"Event: {json.dumps(event)}")
+
+    try:
+        store = BriefingStore()
+        if not store.enabled:
+            raise ValueError("BRIEFING_BUCKET or BRIEFING_ARCHIVE_DIR environment variable is required")
+
+        generator = BriefingGenerator(prompt_file=DELTA_PROMPT_FILE, stream=False)
+        alert_data = run_delta_scan(generator, store)
+
+        print(f"Delta scan found {len(alert_data['alert_items'])} alert items: {alert_data['metrics']}")
+
+        email_sent = False
+        if alert_data["alert"]:
+            email_result = send_email(alert_data)
+            email_sent = email_result["success"]
+            print(f"Alert sent successfully: {email_result}")
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps({
+                "message": "Delta scan complete",
+                "date": alert_data["date"],
+                "alert_items": len(alert_data["alert_items"]),
+                "email_sent": email_sent,
+                "metrics": alert_data["metrics"]
+            })
+        }
+
+    except Exception as e:
+        # No error email: a transient failure is retried by the next hourly scan
+        print(f"Error running delta scan: {str(e)}")
 
----
-Generated by Claude {briefing_data['model']}
-Timestamp: {briefing_data['timestamp']}
+        return {
+            "statusCode": 500,
+            "body": json.dumps({
+                "message": "Failed to run delta scan",
+                "error": str(e)
+            })
+        }
+
+
+def send_email(briefing_data: Dict[str, Any]) -> Dict[str, bool]:
     """
+    Send the daily briefing via AWS SES.
 
-    response = ses_client.send_email(
-        Source=sender_email,
-        Destination={
-            'ToAddresses': [recipient_email]
-        },
-        Message={
-            'Subject': {
-                'Data': subject,
-                'Charset': 'UTF-8'
-            },
-            'Body': {
-                'Text': {
-                    'Data': text_body,
-                    'Charset': 'UTF-8'
+    Args:
+        briefing_data: Dictionary containing briefing content and metadata
+
+    Returns:
+        Dictionary with success status
+    """
+    with span("send_email"):
+        sender_email, recipient_email = get_email_config()
+
+        if not recipient_email or not sender_email:
+            raise ValueError("RECIPIENT_EMAIL and SENDER_EMAIL environment variables are required")
+
+        ses_client = boto3.client('ses')
+
+        title = briefing_data.get("title", "Daily Briefing")
+        subject = f"{title} - {briefing_data['date']}"
+
+        with span("render"):
+            html_body = render_html(briefing_data)
+            text_body = render_text(briefing_data)
+
+        with span("ses.send"):
+            response = ses_client.send_email(
+                Source=sender_email,
+                Destination={
+                    'ToAddresses': [recipient_email]
                 },
-                'Html': {
-                    'Data': html_body,
-                    'Charset': 'UTF-8'
+                Message={
+                    'Subject': {
+                        'Data': subject,
+                        'Charset': 'UTF-8'
+                    },
+                    'Body': {
+                        'Text': {
+                            'Data': text_body,
+                            'Charset': 'UTF-8'
+                        },
+                        'Html': {
+                            'Data': html_body,
+                            'Charset': 'UTF-8'
+                        }
+                    }
                 }
-            }
-        }
-    )
+            )
 
     return {
         "success": True,
@@ -227,14 +287,13 @@ Timestamp: {briefing_data['timestamp']}
 
 def send_error_notification(error_msg: str) -> None:
     """Send an error notification email."""
-    ses_client = boto3.client('ses')
-
-    recipient_email = os.environ.get("RECIPIENT_EMAIL")
-    sender_email = os.environ.get("SENDER_EMAIL")
+    sender_email, recipient_email = get_email_config()
 
     if not recipient_email or not sender_email:
         return
 
+    ses_client = boto3.client('ses')
+
     ses_client.send_email(
         Source=sender_email,
         Destination={
@@ -0,0 +1,251 @@
+import os
+import json
+import time
+import asyncio
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit
+import httpx
+from briefing_items import extract_urls, flag_items, normalize_url, parse_items
+
+
+DEFAULT_CACHE_PATH = "/tmp/link_verdicts.json"
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+# Paywalls and bot protection answer with these even though the page exists
+REACHABLE_STATUSES = {401, 403, 429}
+
+
+class VerdictCache:
+    """JSON-file cache of link verdicts with a TTL, shared across runs."""
+
+    def __init__(self, path: str = None, ttl: float = DEFAULT_CACHE_TTL):
+        self.path = path or os.environ.get("LINK_CACHE_PATH", DEFAULT_CACHE_PATH)
+        self.ttl = ttl
+        self.entries = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached verdict for a URL, or None if missing or expired."""
+        verdict = self.entries.get(url)
+        if verdict is None or time.time() - verdict["checked_at"] > self.ttl:
+            return None
+        return verdict
+
+    def put(self, url: str, verdict: Dict[str, Any]) -> None:
+        self.entries[url] = verdict
+
+    def save(self) -> None:
+        """Write fresh entries back to disk, dropping expired ones."""
+        now = time.time()
+        fresh = {
+            url: verdict for url, verdict in self.entries.items()
+            if now - verdict["checked_at"] <= self.ttl
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(fresh, f)
+        os.replace(tmp_path, self.path)
+
+
+class LinkVerifier:
+    """Checks briefing links concurrently over a shared, pooled async HTTP client."""
+
+    def __init__(
+        self,
+        cache: VerdictCache = None,
+        time_budget: float = 20.0,
+        request_timeout: float = 8.0,
+        max_connections: int = 20,
+        per_host_limit: int = 4,
+    ):
+        self.cache = cache if cache is not None else VerdictCache()
+        self.time_budget = time_budget
+        self.request_timeout = request_timeout
+        self.max_connections = max_connections
+        self.per_host_limit = per_host_limit
+
+    def verify(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Verify a list of URLs within the time budget.
+
+        Args:
+            urls: URLs to check
+
+        Returns:
+            Dict mapping each URL to a verdict with "ok" (True, False, or None
+            when the check was inconclusive), "status" and "reason"
+        """
+        return asyncio.run(self.verify_async(urls))
+
+    async def verify_async(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        verdicts = {}
+        pending_urls = []
+        for url in dict.fromkeys(urls):
+            cached = self.cache.get(url)
+            if cached is not None:
+                verdicts[url] = dict(cached, cached=True)
+            else:
+                pending_urls.append(url)
+
+        if pending_urls:
+            host_limits = {}
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            )
+            async with httpx.AsyncClient(
+                limits=limits,
+                timeout=self.request_timeout,
+                follow_redirects=True,
+                headers={"User-Agent": "Mozilla/5.0 (compatible; DailyBriefingLinkCheck/1.0)"},
+            ) as client:
+                tasks = {
+                    asyncio.create_task(self._check(client, host_limits, url)): url
+                    for url in pending_urls
+                }
+                done, pending = await asyncio.wait(tasks, timeout=self.time_budget)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+
+            for task, url in tasks.items():
+                if task in done:
+                    verdict = task.result()
+                else:
+                    verdict = self._verdict(None, None, "time budget exceeded")
+                verdicts[url] = verdict
+                if verdict["ok"] is not None:
+                    self.cache.put(url, verdict)
+
+            try:
+                self.cache.save()
+            except OSError as e:
+                print(f"Failed to save link verdict cache: {str(e)}")
+
+        return verdicts
+
+    async def _check(self, client: httpx.AsyncClient, host_limits: Dict[str, asyncio.Semaphore],
+                     url: str) -> Dict[str, Any]:
+        host = urlsplit(url).netloc.lower()
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+
+        async with host_limits[host]:
+            try:
+                response = await client.head(url)
+                status = response.status_code
+                if status >= 400:
+                    # Many servers reject HEAD; confirm with a GET without reading the body
+                    async with client.stream("GET", url) as get_response:
+                        status = get_response.status_code
+            except httpx.TimeoutException:
+                return self._verdict(None, None, "timed out")
+            except (httpx.HTTPError, ValueError) as e:
+                return self._verdict(False, None, f"unreachable ({type(e).__name__})")
+            except Exception as e:
+                # Anything else (e.g. an ExceptionGroup from the transport) is our
+                # problem, not the link's; one URL must never abort the whole run
+                return self._verdict(None, None, f"check failed ({type(e).__name__})")
+
+        if status < 400 or status in REACHABLE_STATUSES:
+            return self._verdict(True, status, f"HTTP {status}")
+        if status >= 500:
+            return self._verdict(None, status, f"HTTP {status}")
+        return self._verdict(False, status, f"HTTP {status}")
+
+    @staticmethod
+    def _verdict(ok: Optional[bool], status: Optional[int], reason: str) -> Dict[str, Any]:
+        return {"ok": ok, "status": status, "reason": reason, "checked_at": time.time()}
+
+
+def apply_verdicts(briefing: str, verdicts: Dict[str, Dict[str, Any]], mode: str = "annotate") -> Dict[str, Any]:
+    """
+    Annotate or drop briefing items whose link failed verification.
+
+    Items in the "Last 24 Hours" and "Last Week" sections without any link
+    are treated as failing too, since every research item is required to
+    carry one. Inconclusive verdicts leave the item untouched.
+
+    Args:
+        briefing: Briefing markdown
+        verdicts: Verdicts keyed by URL, as returned by LinkVerifier.verify
+        mode: "annotate" to flag failing items in place, "drop" to remove them
+
+    Returns:
+        Dict with the updated "briefing" and the list of "failed" items
+    """
+    flagged = []
+    failed = []
+    for item in parse_items(briefing):
+        if item["url"] is None:
+            # Only research items must carry a link; bold lines elsewhere are
+            # headings like "**Bottom Line**" or event titles
+            if item["section"] not in ("24h", "week"):
+                continue
+            reason = "no source link"
+        else:
+            verdict = verdicts.get(item["url"])
+            if verdict is None or verdict["ok"] is not False:
+                continue
+            reason = verdict["reason"]
+
+        flagged.append((item, f"Link could not be verified ({reason})"))
+        failed.append({"title": item["title"], "url": item["url"], "reason": reason})
+
+    return {"briefing": flag_items(briefing, flagged, mode), "failed": failed}
+
+
+def verify_briefing_links(briefing_data: Dict[str, Any], mode: str = None,
+                          verifier: LinkVerifier = None) -> Dict[str, Any]:
+    """
+    Verify every link in a generated briefing and flag or drop failing items.
+
+    Args:
+        briefing_data: Output of BriefingGenerator.generate_briefing, updated in place
+        mode: "annotate", "drop" or "off" (defaults to LINK_CHECK_MODE, then "annotate")
+        verifier: LinkVerifier to use (defaults to one configured from the environment)
+
+    Returns:
+        The same briefing_data dict with "briefing" updated and a "link_check" summary
+    """
+    mode = mode or os.environ.get("LINK_CHECK_MODE", "annotate")
+    if mode == "off":
+        return briefing_data
+
+    urls = extract_urls(briefing_data["briefing"])
+
+    # Pages this run's web search returned were just fetched by the search
+    # backend, so only the rest need an HTTP round trip
+    retrieved = {
+        normalize_url(result["url"])
+        for result in briefing_data.get("citations", {}).get("results", [])
+    }
+    verdicts = {
+        url: LinkVerifier._verdict(True, None, "returned by web search")
+        for url in urls if normalize_url(url) in retrieved
+    }
+    pending_urls = [url for url in urls if url not in verdicts]
+    if pending_urls:
+        if verifier is None:
+            verifier = LinkVerifier(
+                time_budget=float(os.environ.get("LINK_CHECK_BUDGET_SECONDS", "20"))
+            )
+        verdicts.update(verifier.verify(pending_urls))
+
+    result = apply_verdicts(briefing_data["briefing"], verdicts, mode)
+    briefing_data["briefing"] = result["briefing"]
+    briefing_data["link_check"] = {
+        "mode": mode,
+        "checked": len(pending_urls),
+        "from_search": len(urls) - len(pending_urls),
+        "unknown": sum(1 for verdict in verdicts.values() if verdict["ok"] is None),
+        "failed": result["failed"],
+    }
+    return briefing_data
@@ -0,0 +1,181 @@
+import html
+import markdown
+from typing import Dict, Any
+from urllib.parse import urlsplit
+from markdown.treeprocessors import Treeprocessor
+
+
+SAFE_URL_SCHEMES = {"", "http", "https", "mailto"}
+
+
+class _SafeLinks(Treeprocessor):
+    """Drop link and image URLs with schemes like javascript: or data:."""
+
+    def run(self, root):
+        for element in root.iter():
+            for attribute in ("href", "src"):
+                value = element.get(attribute)
+                if value is None:
+                    continue
+                # Browsers ignore whitespace and control characters inside the scheme
+                cleaned = "".join(ch for ch in value if ch > " ")
+                try:
+                    scheme = urlsplit(cleaned).scheme.lower()
+                except ValueError:
+                    scheme = None
+                if scheme not in SAFE_URL_SCHEMES:
+                    element.set(attribute, "#")
+
+
+def _markdown_to_html(text: str, allow_raw_html: bool) -> str:
+    md = markdown.Markdown(extensions=['tables', 'fenced_code', 'nl2br'])
+    if not allow_raw_html:
+        # Without these, raw HTML in the model output is escaped as text
+        md.preprocessors.deregister('html_block')
+        md.inlinePatterns.deregister('html')
+        md.treeprocessors.register(_SafeLinks(md), 'safe_links', 0)
+    return md.convert(text)
+
+
+def render_html(briefing_data: Dict[str, Any], allow_raw_html: bool = True) -> str:
+    """
+    Render a briefing as a standalone HTML document.
+
+    Args:
+        briefing_data: Dictionary containing briefing content and metadata
+        allow_raw_html: Pass raw HTML in the markdown through (fine for mail
+            clients, which sanitize it); set to False when serving to browsers
+            to escape it and drop unsafe link schemes
+
+    Returns:
+        HTML string used for the email body or web page
+    """
+    title = html.escape(briefing_data.get("title", "Daily Briefing"))
+
+    # Convert markdown to HTML
+    briefing_html = _markdown_to_html(briefing_data['briefing'], allow_raw_html)
+
+    # Create HTML email body
+    html_body = f"""
+    <html>
+    <head>
+        <style>
+            body {{
+                font-family: Arial, sans-serif;
+                line-height: 1.6;
+                color: #333;
+                max-width: 800px;
+                margin: 0 auto;
+                padding: 20px;
+            }}
+            .header {{
+                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                color: white;
+                padding: 30px;
+                border-radius: 10px 10px 0 0;
+                text-align: center;
+            }}
+            .content {{
+                background: #f9f9f9;
+                padding: 30px;
+                border-radius: 0 0 10px 10px;
+            }}
+            .content h1, .content h2, .content h3 {{
+                color: #444;
+                margin-top: 1.5em;
+                margin-bottom: 0.5em;
+            }}
+            .content h1:first-child, .content h2:first-child, .content h3:first-child {{
+                margin-top: 0;
+            }}
+            .content ul, .content ol {{
+                margin: 1em 0;
+                padding-left: 2em;
+            }}
+            .content li {{
+                margin: 0.5em 0;
+            }}
+            .content p {{
+                margin: 1em 0;
+            }}
+            .content code {{
+                background: #e8e8e8;
+                padding: 2px 6px;
+                border-radius: 3px;
+                font-family: monospace;
+            }}
+            .content pre {{
+                background: #e8e8e8;
+                padding: 15px;
+                border-radius: 5px;
+                overflow-x: auto;
+            }}
+            .content blockquote {{
+                border-left: 4px solid #667eea;
+                margin: 1em 0;
+                padding-left: 1em;
+                color: #666;
+            }}
+            .content table {{
+                border-collapse: collapse;
+                width: 100%;
+                margin: 1em 0;
+            }}
+            .content th, .content td {{
+                border: 1px solid #ddd;
+                padding: 8px;
+                text-align: left;
+            }}
+            .content th {{
+                background: #f0f0f0;
+            }}
+            .footer {{
+                margin-top: 20px;
+                padding: 20px;
+                text-align: center;
+                color: #666;
+                font-size: 12px;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="header">
+            <h1>Your {title}</h1>
+            <p>{html.escape(str(briefing_data['date']))}</p>
+        </div>
+        <div class="content">
+            {briefing_html}
+        </div>
+        <div class="footer">
+            <p>Generated by Claude {html.escape(str(briefing_data['model']))}</p>
+            <p>Timestamp: {html.escape(str(briefing_data['timestamp']))}</p>
+        </div>
+    </body>
+    </html>
+    """
+
+    return html_body
+
+
+def render_text(briefing_data: Dict[str, Any]) -> str:
+    """
+    Render a briefing as plain text.
+
+    Args:
+        briefing_data: Dictionary containing briefing content and metadata
+
+    Returns:
+        Plain text string used for the email body
+    """
+    title = briefing_data.get("title", "Daily Briefing")
+
+    text_body = f"""
+{title} - {briefing_data['date']}
+
+{briefing_data['briefing']}
+
+---
+Generated by Claude {briefing_data['model']}
+Timestamp: {briefing_data['timestamp']}
+    """
+    return text_body
@@ -0,0 +1,235 @@
+import os
+import io
+import json
+import time
+import uuid
+import random
+import pstats
+import cProfile
+import tracemalloc
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Iterator
+
+
+DEFAULT_NAMESPACE = "DailyBriefing"
+
+_current_tracer = contextvars.ContextVar("current_tracer", default=None)
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed stage of an invocation, with attributes and numeric metrics."""
+
+    def __init__(self, name: str, parent: Optional[str] = None, attributes: Dict[str, Any] = None):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.metrics = {}
+        self.start = time.time()
+        self.duration_ms = None
+        self.error = None
+
+    def set(self, key: str, value: Any) -> None:
+        """Attach a descriptive attribute (exported as a log field)."""
+        self.attributes[key] = value
+
+    def metric(self, name: str, value: float, unit: str = "None") -> None:
+        """Attach a numeric metric (exported as a CloudWatch metric under EMF)."""
+        self.metrics[name] = {"value": value, "unit": unit}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "parent": self.parent,
+            "start": self.start,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            "attributes": self.attributes,
+            "metrics": self.metrics,
+        }
+
+
+class Tracer:
+    """
+    Collects spans for one invocation and exports them when the trace ends.
+
+    Exporters:
+        "emf": one CloudWatch Embedded Metric Format record per span, printed
+            to stdout so Lambda's log stream turns durations into metrics
+        "file": JSON lines appended to a local file (used in tests)
+        "none": keep spans in memory only
+    """
+
+    def __init__(self, exporter: str = None, path: str = None, namespace: str = DEFAULT_NAMESPACE,
+                 attributes: Dict[str, Any] = None):
+        self.exporter = exporter or os.environ.get("TRACE_EXPORTER", "emf")
+        self.path = path or os.environ.get("TRACE_FILE", "traces.jsonl")
+        self.namespace = namespace
+        self.trace_id = uuid.uuid4().hex
+        self.attributes = dict(attributes or {})
+        self.spans = []
+        self.profiles = []
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        parent = _current_span.get()
+        current = Span(name, parent.name if parent else None, attributes)
+        token = _current_span.set(current)
+        start = time.perf_counter()
+        try:
+            yield current
+        except Exception as e:
+            current.error = f"{type(e).__name__}: {str(e)}"
+            raise
+        finally:
+            current.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+            _current_span.reset(token)
+            self.spans.append(current)
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Return every span and profile as an exportable record."""
+        records = []
+        for recorded in self.spans:
+            record = {"type": "span", "trace_id": self.trace_id, **self.attributes, **recorded.to_dict()}
+            records.append(record)
+        for profile in self.profiles:
+            records.append({"type": "profile", "trace_id": self.trace_id, **self.attributes, **profile})
+        return records
+
+    def _emf_record(self, recorded: Span) -> Dict[str, Any]:
+        metrics = [{"Name": "Duration", "Unit": "Milliseconds"}]
+        record = {
+            "_aws": {
+                "Timestamp": int(recorded.start * 1000),
+                "CloudWatchMetrics": [{
+                    "Namespace": self.namespace,
+                    "Dimensions": [["Stage"]],
+                    "Metrics": metrics,
+                }],
+            },
+            "Stage": recorded.name,
+            "Duration": recorded.duration_ms,
+            "trace_id": self.trace_id,
+            "parent": recorded.parent,
+            "error": recorded.error,
+            **self.attributes,
+            **recorded.attributes,
+        }
+        for name, metric in recorded.metrics.items():
+            metrics.append({"Name": name, "Unit": metric["unit"]})
+            record[name] = metric["value"]
+        return record
+
+    def export(self) -> None:
+        """Write the collected spans and profiles to the configured exporter."""
+        if self.exporter == "emf":
+            for recorded in self.spans:
+                print(json.dumps(self._emf_record(recorded), default=str))
+            for profile in self.profiles:
+                print(json.dumps({"type": "profile", "trace_id": self.trace_id, **profile}, default=str))
+        elif self.exporter == "file":
+            with open(self.path, 'a') as f:
+                for record in self.records():
+                    f.write(json.dumps(record, default=str) + "\n")
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Span]:
+    """
+    Time a stage under the active tracer.
+
+    Outside a trace this still yields a Span, so callers can set attributes
+    and metrics unconditionally; it just isn't recorded anywhere.
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield Span(name, attributes=attributes)
+        return
+    with tracer.span(name, **attributes) as current:
+        yield current
+
+
+@contextmanager
+def trace(exporter: str = None, path: str = None, **attributes) -> Iterator[Tracer]:
+    """Activate a tracer for the enclosed block and export it on exit."""
+    tracer = Tracer(exporter=exporter, path=path, attributes=attributes)
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+        try:
+            tracer.export()
+        except Exception as e:
+            print(f"Failed to export trace: {str(e)}")
+
+
+def profiler_mode(event: Dict[str, Any]) -> Optional[str]:
+    """
+    Decide whether this invocation should be profiled, and how.
+
+    {"profile": "cprofile"} or {"profile": "tracemalloc"} in the event turns
+    profiling on explicitly. Otherwise PROFILE_SAMPLE_RATE (0.0-1.0, default
+    0) profiles that fraction of invocations with cProfile.
+    """
+    mode = event.get("profile")
+    if mode:
+        return mode
+    if random.random() < float(os.environ.get("PROFILE_SAMPLE_RATE", "0")):
+        return "cprofile"
+    return None
+
+
+@contextmanager
+def profile(mode: Optional[str], limit: int = 25) -> Iterator[None]:
+    """
+    Profile the enclosed block with cProfile or tracemalloc.
+
+    The top entries are attached to the active tracer and exported with its
+    spans. A mode of None does nothing.
+
+    Args:
+        mode: "cprofile", "tracemalloc" or None
+        limit: Number of top functions or allocation sites to keep
+    """
+    if mode not in ("cprofile", "tracemalloc"):
+        if mode:
+            print(f"Unknown profiler mode {mode!r}, skipping profiling")
+        yield
+        return
+
+    tracer = _current_tracer.get()
+    result = {"profiler": mode}
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+            result["stats"] = output.getvalue()
+    else:
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        try:
+            yield
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            if not already_tracing:
+                tracemalloc.stop()
+            result["current_bytes"] = current
+            result["peak_bytes"] = peak
+            result["top_allocations"] = [
+                str(stat) for stat in snapshot.statistics("lineno")[:limit]
+            ]
+
+    if tracer is not None:
+        tracer.profiles.append(result)
+    else:
+        print(json.dumps(result, default=str))
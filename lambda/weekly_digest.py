@@ -0,0 +1,311 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, List, Optional
+from briefing_items import normalize_title, normalize_url, parse_items
+
+
+SUMMARY_MODEL = "claude-haiku-4-5-20251001"
+
+TIER_ORDER = ["high", "medium", "radar"]
+TIER_HEADINGS = {
+    "high": "High Priority (Score 9-10)",
+    "medium": "Medium Priority (Score 7-8)",
+    "radar": "Notable Developments (Score 5-6)",
+}
+
+
+def _tier_for(score: Optional[float], fallback: Optional[str]) -> str:
+    if score is None:
+        return fallback or "radar"
+    if score >= 9:
+        return "high"
+    if score >= 7:
+        return "medium"
+    return "radar"
+
+
+class WeeklyDigest:
+    """
+    Running merge of the items from stored daily briefings.
+
+    Items are deduplicated by normalized URL and normalized title. Scores are
+    kept per source date so days can be pruned as the window moves forward
+    while still reporting the max score across the remaining days.
+    """
+
+    def __init__(self, items: List[Dict[str, Any]] = None, dates: List[str] = None):
+        self.items = items or []
+        self.dates = dates or []
+
+    @classmethod
+    def from_dict(cls, state: Optional[Dict[str, Any]]) -> "WeeklyDigest":
+        if not state:
+            return cls()
+        return cls(items=state.get("items", []), dates=state.get("dates", []))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"items": self.items, "dates": self.dates}
+
+    def _find(self, url_key: Optional[str], title_key: str) -> Optional[Dict[str, Any]]:
+        for existing in self.items:
+            if url_key and url_key in existing["url_keys"]:
+                return existing
+            if title_key and title_key in existing["title_keys"]:
+                return existing
+        return None
+
+    def add_briefing(self, briefing_data: Dict[str, Any], date_iso: str) -> int:
+        """
+        Merge one day's briefing into the digest.
+
+        Only items from the "Last 24 Hours" and "Last Week" sections are
+        merged; further-reading links and the like are ignored.
+
+        Args:
+            briefing_data: Stored output of BriefingGenerator.generate_briefing
+            date_iso: ISO date the briefing belongs to
+
+        Returns:
+            Number of items merged
+        """
+        if date_iso in self.dates:
+            return 0
+
+        merged = 0
+        for item in parse_items(briefing_data["briefing"]):
+            if item["section"] not in ("24h", "week"):
+                continue
+
+            url_key = normalize_url(item["url"]) if item["url"] else None
+            title_key = normalize_title(item["title"])
+            existing = self._find(url_key, title_key)
+
+            if existing is None:
+                existing = {
+                    "title": item["title"],
+                    "url": item["url"],
+                    "published": item["published"],
+                    "tier": item["tier"],
+                    "url_keys": [],
+                    "title_keys": [],
+                    "scores": {},
+                }
+                self.items.append(existing)
+
+            if url_key and url_key not in existing["url_keys"]:
+                existing["url_keys"].append(url_key)
+            if title_key and title_key not in existing["title_keys"]:
+                existing["title_keys"].append(title_key)
+            if existing["url"] is None:
+                existing["url"] = item["url"]
+            if existing["published"] is None:
+                existing["published"] = item["published"]
+            if TIER_ORDER.index(item["tier"] or "radar") < TIER_ORDER.index(existing["tier"] or "radar"):
+                existing["tier"] = item["tier"]
+
+            previous = existing["scores"].get(date_iso)
+            if item["score"] is not None and (previous is None or item["score"] > previous):
+                existing["scores"][date_iso] = item["score"]
+            elif date_iso not in existing["scores"]:
+                existing["scores"][date_iso] = None
+            merged += 1
+
+        self.dates = sorted(self.dates + [date_iso])
+        return merged
+
+    def prune(self, start_iso: str) -> None:
+        """Forget every day before start_iso, dropping items only seen on those days."""
+        self.dates = [d for d in self.dates if d >= start_iso]
+        remaining = []
+        for item in self.items:
+            item["scores"] = {d: s for d, s in item["scores"].items() if d >= start_iso}
+            if item["scores"]:
+                remaining.append(item)
+        self.items = remaining
+
+    def discard(self, date_iso: str) -> None:
+        """Forget one day, e.g. before merging a re-generated briefing for it."""
+        self.dates = [d for d in self.dates if d != date_iso]
+        remaining = []
+        for item in self.items:
+            item["scores"].pop(date_iso, None)
+            if item["scores"]:
+                remaining.append(item)
+        self.items = remaining
+
+    def ranked_items(self) -> List[Dict[str, Any]]:
+        """
+        Return the merged items, best first.
+
+        Returns:
+            List of item dicts with title, url, published, score (max across
+            days, None if never scored), tier and the dates the item appeared on
+        """
+        ranked = []
+        for item in self.items:
+            scores = [s for s in item["scores"].values() if s is not None]
+            score = max(scores) if scores else None
+            ranked.append({
+                "title": item["title"],
+                "url": item["url"],
+                "published": item["published"],
+                "score": score,
+                "tier": _tier_for(score, item["tier"]),
+                "dates": sorted(item["scores"]),
+            })
+        ranked.sort(key=lambda i: (TIER_ORDER.index(i["tier"]), -(i["score"] or 0)))
+        return ranked
+
+    def to_markdown(self, title: str, summary: str = None) -> str:
+        """Render the digest in the same markdown shape as a daily briefing."""
+        lines = [f"# {title}", ""]
+        if summary:
+            lines.extend([summary.strip(), ""])
+
+        items = self.ranked_items()
+        for tier in TIER_ORDER:
+            tier_items = [i for i in items if i["tier"] == tier]
+            if not tier_items:
+                continue
+            lines.extend([f"### {TIER_HEADINGS[tier]}", ""])
+            for item in tier_items:
+                link = item["url"] or "no link"
+                if tier == "radar":
+                    lines.append(f"- **{item['title']}** ({link})")
+                    continue
+                seen = ", ".join(
+                    datetime.strptime(d, "%Y-%m-%d").strftime("%B %d") for d in item["dates"]
+                )
+                lines.append(f"**{item['title']}**")
+                lines.append(f"- **Link:** {link}")
+                if item["published"]:
+                    lines.append(f"- **Published:** {item['published']}")
+                if item["score"] is not None:
+                    lines.append(f"- **Score:** {item['score']:g}/10")
+                lines.append(f"- **Seen in:** {seen}")
+                lines.append("")
+            if lines[-1] != "":
+                lines.append("")
+
+        if not items:
+            lines.append("No items were found in the stored briefings for this week.")
+
+        return "\n".join(lines).strip()
+
+
+def summarize_items(client: Any, items: List[Dict[str, Any]], model: str = SUMMARY_MODEL) -> str:
+    """
+    Write a short summary of the merged items with a single small model call.
+
+    No tools and no extended thinking are used; the model only sees the
+    titles, scores and links that were already researched.
+
+    Args:
+        client: Anthropic client
+        items: Ranked digest items
+        model: Model to summarize with
+
+    Returns:
+        Summary paragraph(s) in markdown
+    """
+    listing = "\n".join(
+        f"- {item['title']} (score {item['score'] if item['score'] is not None else 'n/a'}) {item['url'] or ''}"
+        for item in items
+    )
+    response = client.messages.create(
+        model=model,
+        max_tokens=1024,
+        messages=[{
+            "role": "user",
+            "content": (
+                "These are the AI developments from the past week's daily briefings, "
+                "ranked by relevance to an engineering leader at an applied AI/ML consultancy:\n\n"
+                f"{listing}\n\n"
+                "Write a 2-3 paragraph weekly summary of the most important themes and what to act on. "
+                "Use only the items above, do not add new facts, and output only the summary."
+            )
+        }]
+    )
+    return "".join(block.text for block in response.content if block.type == "text").strip()
+
+
+def update_weekly_digest(store: Any, briefing_data: Dict[str, Any], days: int = 7) -> None:
+    """
+    Merge a just-stored daily briefing into the running digest.
+
+    Called whenever a daily briefing is saved, so the weekly build normally
+    finds every day already merged and reads no briefings at all.
+
+    Args:
+        store: BriefingStore holding the digest state
+        briefing_data: The briefing that was just stored
+        days: Window length in days
+    """
+    date_iso = store.date_key(briefing_data)
+    start = date.fromisoformat(date_iso) - timedelta(days=days - 1)
+
+    digest = WeeklyDigest.from_dict(store.load_state("weekly_digest"))
+    digest.prune(start.isoformat())
+    # A re-run for the same day replaces that day's items
+    digest.discard(date_iso)
+    digest.add_briefing(briefing_data, date_iso)
+    store.save_state("weekly_digest", digest.to_dict())
+
+
+def build_weekly_digest(store: Any, end: date = None, days: int = 7, client: Any = None) -> Dict[str, Any]:
+    """
+    Build the weekly digest from the stored daily briefings.
+
+    The running digest is kept in the store and updated as each daily
+    briefing is saved (see update_weekly_digest), so this only lists the
+    stored dates and loads the days in the window that are missing from
+    it, then prunes days that fell out of the window. A build for a past
+    end leaves the running digest as it was.
+
+    Args:
+        store: BriefingStore holding the daily briefings
+        end: Last day of the window (defaults to today)
+        days: Window length in days
+        client: Anthropic client for the optional summary (None skips it)
+
+    Returns:
+        Dict shaped like generate_briefing's output, ready for send_email
+    """
+    end = end or date.today()
+    start = end - timedelta(days=days - 1)
+
+    digest = WeeklyDigest.from_dict(store.load_state("weekly_digest"))
+    digest.prune(start.isoformat())
+    # A backdated build drops the later days from this copy only, so it isn't
+    # saved back over the running state
+    later = [date_iso for date_iso in digest.dates if date_iso > end.isoformat()]
+    for date_iso in later:
+        digest.discard(date_iso)
+    missing = [
+        date_iso for date_iso in store.list_dates()
+        if start.isoformat() <= date_iso <= end.isoformat() and date_iso not in digest.dates
+    ]
+    for date_iso in missing:
+        briefing_data = store.load(date_iso)
+        if briefing_data is not None:
+            digest.add_briefing(briefing_data, date_iso)
+    if not later:
+        store.save_state("weekly_digest", digest.to_dict())
+
+    summary = None
+    model = None
+    items = digest.ranked_items()
+    if client is not None and items:
+        summary = summarize_items(client, items)
+        model = SUMMARY_MODEL
+
+    date_range = f"{start.strftime('%B %d')} - {end.strftime('%B %d, %Y')}"
+    return {
+        "title": "Weekly Digest",
+        "date": date_range,
+        "date_iso": end.isoformat(),
+        "briefing": digest.to_markdown(f"AI Weekly Digest - {date_range}", summary),
+        "item_count": len(items),
+        "source_dates": digest.dates,
+        "model": model or "n/a",
+        "timestamp": datetime.now().isoformat(),
+    }
@@ -0,0 +1,212 @@
+import unittest
+from unittest.mock import Mock, patch
+import os
+import sys
+import json
+import shutil
+import tempfile
+from wsgiref.util import setup_testing_defaults
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+import archive_server
+from archive_server import ArchiveServer, WSGIApp, handler
+from briefing_store import BriefingStore
+
+
+def briefing(date_iso, text):
+    """A stored briefing for a date."""
+    return {
+        "date": date_iso,
+        "date_iso": date_iso,
+        "briefing": f"# AI Research Briefing - {date_iso}\n\n{text}",
+        "model": "claude-sonnet-4-5-20250929",
+        "timestamp": f"{date_iso}T11:04:30.123456",
+    }
+
+
+class TestArchiveServer(unittest.TestCase):
+    """Test cases for the cached read-only briefing endpoint."""
+
+    def setUp(self):
+        """Set up a local archive with two briefings."""
+        self.directory = tempfile.mkdtemp()
+        store = BriefingStore(directory=self.directory)
+        store.save(briefing("2026-01-12", "Monday items."))
+        store.save(briefing("2026-01-13", "Tuesday items."))
+        self.store = Mock(wraps=store)
+        self.server = ArchiveServer(self.store, cache_ttl=300)
+
+    def tearDown(self):
+        """Remove the local archive."""
+        shutil.rmtree(self.directory)
+
+    def test_latest_html(self):
+        """Test that the root serves the latest briefing as HTML with caching headers."""
+        status, headers, body = self.server.respond("GET", "/", {})
+
+        self.assertEqual(status, 200)
+        self.assertIn(b"Tuesday items.", body)
+        self.assertEqual(headers["Content-Type"], "text/html; charset=utf-8")
+        self.assertEqual(headers["Last-Modified"], "Tue, 13 Jan 2026 11:04:30 GMT")
+        self.assertEqual(headers["Cache-Control"], "public, max-age=300")
+        self.assertTrue(headers["ETag"].startswith('"') and headers["ETag"].endswith('"'))
+        self.assertEqual(headers["Content-Length"], str(len(body)))
+
+    def test_dated_json(self):
+        """Test serving a past briefing as JSON."""
+        status, headers, body = self.server.respond("GET", "/briefings/2026-01-12.json", {})
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["Content-Type"], "application/json")
+        self.assertEqual(headers["Cache-Control"], "public, max-age=86400")
+        self.assertIn("Monday items.", json.loads(body)["briefing"])
+
+    def test_json_publishes_only_public_fields(self):
+        """Test that thinking, usage, citations and link checks stay out of the JSON."""
+        internal = briefing("2026-01-14", "Wednesday items.")
+        internal.update({
+            "thinking_summary": "Private reasoning.",
+            "usage": {"input_tokens": 150000, "output_tokens": 12000},
+            "citations": [{"url": "https://example.com/a", "title": "A"}],
+            "link_check": {"checked": 3, "failed": []},
+        })
+        BriefingStore(directory=self.directory).save(internal)
+
+        _, _, body = self.server.respond("GET", "/briefings/2026-01-14.json", {})
+
+        self.assertEqual(set(json.loads(body)), set(archive_server.PUBLIC_FIELDS) - {"title"})
+        self.assertNotIn(b"Private reasoning.", body)
+
+    def test_html_escapes_raw_html(self):
+        """Test that model output can't inject markup or script links into the web view."""
+        BriefingStore(directory=self.directory).save(briefing(
+            "2026-01-14",
+            '<script>alert(1)</script>\n\n[bad](javascript:alert(1)) and [good](https://example.com/a)',
+        ))
+
+        _, _, body = self.server.respond("GET", "/briefings/2026-01-14", {})
+
+        self.assertNotIn(b"<script>", body)
+        self.assertIn(b"&lt;script&gt;", body)
+        self.assertNotIn(b"javascript:", body)
+        self.assertIn(b'href="https://example.com/a"', body)
+
+    def test_private_cache_scope(self):
+        """Test that responses to signed requests are marked private."""
+        server = ArchiveServer(self.store, cache_ttl=300, cache_scope="private")
+
+        _, headers, _ = server.respond("GET", "/briefings/2026-01-12", {})
+
+        self.assertEqual(headers["Cache-Control"], "private, max-age=86400")
+
+    def test_index(self):
+        """Test the index of stored dates."""
+        status, _, body = self.server.respond("GET", "/briefings.json", {})
+        self.assertEqual(json.loads(body), {"dates": ["2026-01-12", "2026-01-13"]})
+
+        status, _, body = self.server.respond("GET", "/briefings", {})
+        self.assertEqual(status, 200)
+        self.assertLess(body.index(b"2026-01-13"), body.index(b"2026-01-12"))
+
+    def test_not_found_and_method(self):
+        """Test unknown paths, missing dates and unsupported methods."""
+        self.assertEqual(self.server.respond("GET", "/briefings/2025-01-01", {})[0], 404)
+        self.assertEqual(self.server.respond("GET", "/briefings/../secrets", {})[0], 404)
+        self.assertEqual(self.server.respond("POST", "/latest", {})[0], 405)
+
+    def test_conditional_requests(self):
+        """Test If-None-Match and If-Modified-Since revalidation."""
+        _, headers, _ = self.server.respond("GET", "/briefings/2026-01-13", {})
+
+        status, _, body = self.server.respond("GET", "/briefings/2026-01-13", {"If-None-Match": headers["ETag"]})
+        self.assertEqual(status, 304)
+        self.assertEqual(body, b"")
+
+        status, _, _ = self.server.respond("GET", "/briefings/2026-01-13", {"If-None-Match": '"stale"'})
+        self.assertEqual(status, 200)
+
+        status, _, _ = self.server.respond(
+            "GET", "/briefings/2026-01-13", {"If-Modified-Since": headers["Last-Modified"]}
+        )
+        self.assertEqual(status, 304)
+
+        status, _, _ = self.server.respond(
+            "GET", "/briefings/2026-01-13", {"If-Modified-Since": "Mon, 12 Jan 2026 00:00:00 GMT"}
+        )
+        self.assertEqual(status, 200)
+
+    def test_conditional_request_edge_cases(self):
+        """Test weak validators, "-0000" dates and unparseable dates."""
+        _, headers, _ = self.server.respond("GET", "/latest", {})
+
+        status, _, _ = self.server.respond("GET", "/latest", {"If-None-Match": f'"stale", W/{headers["ETag"]}'})
+        self.assertEqual(status, 304)
+
+        status, _, _ = self.server.respond("GET", "/latest", {"If-Modified-Since": "Tue, 13 Jan 2026 12:00:00 -0000"})
+        self.assertEqual(status, 304)
+
+        status, _, _ = self.server.respond("GET", "/latest", {"If-Modified-Since": "Tue, 13 Jan 2026 11:00:00 -0000"})
+        self.assertEqual(status, 200)
+
+        status, _, _ = self.server.respond("GET", "/latest", {"If-Modified-Since": "yesterday"})
+        self.assertEqual(status, 200)
+
+    def test_repeat_requests_served_from_cache(self):
+        """Test that warm requests neither read the store nor re-render."""
+        first = self.server.respond("GET", "/briefings/2026-01-13", {})
+
+        with patch.object(archive_server, 'render_html') as mock_render:
+            second = self.server.respond("GET", "/briefings/2026-01-13/", {})
+            mock_render.assert_not_called()
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.store.load.call_count, 1)
+
+    def test_latest_refreshes_after_ttl(self):
+        """Test that the latest view picks up a new briefing once its cache entry expires."""
+        self.server.respond("GET", "/latest", {})
+        BriefingStore(directory=self.directory).save(briefing("2026-01-14", "Wednesday items."))
+
+        self.assertIn(b"Tuesday items.", self.server.respond("GET", "/latest", {})[2])
+
+        self.server.cache["/latest"]["expires"] = 0
+        self.assertIn(b"Wednesday items.", self.server.respond("GET", "/latest", {})[2])
+
+    def test_function_url_handler(self):
+        """Test the Lambda Function URL event and response shapes."""
+        archive_server._server = self.server
+        try:
+            event = {
+                "rawPath": "/latest.json",
+                "headers": {"if-none-match": "*"},
+                "requestContext": {"http": {"method": "GET"}},
+            }
+            result = handler(event, None)
+            self.assertEqual(result["statusCode"], 304)
+
+            event["headers"] = {}
+            result = handler(event, None)
+            self.assertEqual(result["statusCode"], 200)
+            self.assertEqual(json.loads(result["body"])["date_iso"], "2026-01-13")
+            self.assertFalse(result["isBase64Encoded"])
+        finally:
+            archive_server._server = None
+
+    def test_wsgi_app(self):
+        """Test the local WSGI stand-in."""
+        environ = {"PATH_INFO": "/briefings/2026-01-12", "HTTP_IF_NONE_MATCH": '"stale"'}
+        setup_testing_defaults(environ)
+        start_response = Mock()
+
+        body = b"".join(WSGIApp(self.server)(environ, start_response))
+
+        self.assertIn(b"Monday items.", body)
+        status, headers = start_response.call_args[0]
+        self.assertEqual(status, "200 OK")
+        self.assertIn("ETag", dict(headers))
+
+
+if __name__ == '__main__':
+    unittest.main()
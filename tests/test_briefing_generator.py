@@ -3,11 +3,14 @@ from unittest.mock import Mock, patch, MagicMock, mock_open
 import os
 import sys
 import tempfile
+import time
+from datetime import datetime
 
 # Add lambda directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
 
 from briefing_generator import BriefingGenerator
+from tracing import trace
 
 
 class TestBriefingGenerator(unittest.TestCase):
@@ -179,6 +182,124 @@ This is a note that should be ignored."""
         finally:
             os.unlink(temp_file)
 
+    def test_generate_briefing_for_date_with_injected_client(self):
+        """Test generating a backfill briefing with an injected client and no API key."""
+        del os.environ["ANTHROPIC_API_KEY"]
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+            f.write(self.test_prompt)
+            temp_file = f.name
+
+        try:
+            mock_text_block = Mock()
+            mock_text_block.type = "text"
+            mock_text_block.text = "# AI Research Briefing\nNow let me look at more.\nContent."
+
+            mock_response = Mock()
+            mock_response.content = [mock_text_block]
+            mock_response.usage.input_tokens = 1200
+            mock_response.usage.output_tokens = 300
+            mock_response.usage.server_tool_use.web_search_requests = 4
+
+            mock_client = Mock()
+            mock_client.messages.create.return_value = mock_response
+
+            generator = BriefingGenerator(prompt_file=temp_file, client=mock_client)
+            result = generator.generate_briefing(date=datetime(2026, 1, 5))
+
+            self.assertEqual(result["date"], "January 05, 2026")
+            self.assertEqual(result["date_iso"], "2026-01-05")
+            self.assertEqual(result["narration_filtered"], 1)
+            self.assertEqual(result["usage"], {
+                "input_tokens": 1200, "output_tokens": 300, "web_search_requests": 4
+            })
+            prompt = mock_client.messages.create.call_args[1]["messages"][0]["content"]
+            self.assertIn("Test prompt for January 05, 2026", prompt)
+        finally:
+            os.unlink(temp_file)
+
+    def test_generate_briefing_streaming(self):
+        """Test that streaming returns the final message from the stream."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+            f.write(self.test_prompt)
+            temp_file = f.name
+
+        try:
+            mock_text_block = Mock()
+            mock_text_block.type = "text"
+            mock_text_block.text = "Streamed briefing."
+
+            mock_response = Mock()
+            mock_response.content = [mock_text_block]
+
+            def events():
+                yield Mock(type="message_start")
+                yield Mock(type="content_block_start")
+                # The model is still thinking; no token has been generated yet
+                time.sleep(0.05)
+                yield Mock(type="content_block_delta")
+
+            mock_stream = MagicMock()
+            mock_stream.__enter__.return_value = mock_stream
+            mock_stream.__iter__.return_value = events()
+            mock_stream.get_final_message.return_value = mock_response
+
+            mock_client = Mock()
+            mock_client.messages.stream.return_value = mock_stream
+
+            generator = BriefingGenerator(prompt_file=temp_file, client=mock_client, stream=True)
+            with trace(exporter="none") as tracer:
+                result = generator.generate_briefing()
+
+            self.assertEqual(result["briefing"], "Streamed briefing.")
+            mock_client.messages.stream.assert_called_once()
+            mock_client.messages.create.assert_not_called()
+
+            model_span = next(recorded for recorded in tracer.spans if recorded.name == "model")
+            self.assertGreaterEqual(model_span.metrics["TimeToFirstToken"]["value"], 50)
+        finally:
+            os.unlink(temp_file)
+
+    def test_generate_briefing_keeps_citation_table(self):
+        """Test that search results are kept as a citation table and joined against the links."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+            f.write(self.test_prompt)
+            temp_file = f.name
+
+        try:
+            mock_search_block = Mock()
+            mock_search_block.type = "web_search_tool_result"
+            mock_search_block.content = [
+                Mock(url="https://example.com/paper", title="Paper", page_age="January 4, 2026"),
+            ]
+
+            mock_text_block = Mock()
+            mock_text_block.type = "text"
+            mock_text_block.text = (
+                "# AI Research Briefing\n## Last 24 Hours\n"
+                "**Paper**\n- **Link:** https://example.com/paper\n\n"
+                "**Invented**\n- **Link:** https://example.com/invented"
+            )
+
+            mock_response = Mock()
+            mock_response.content = [mock_search_block, mock_text_block]
+            mock_response.usage.input_tokens = 100
+            mock_response.usage.output_tokens = 50
+
+            mock_client = Mock()
+            mock_client.messages.create.return_value = mock_response
+
+            generator = BriefingGenerator(prompt_file=temp_file, client=mock_client)
+            result = generator.generate_briefing(date=datetime(2026, 1, 5))
+
+            self.assertEqual(result["citations"]["results"][0]["page_age"], "January 4, 2026")
+            audit = {finding["title"]: finding for finding in result["link_audit"]}
+            self.assertTrue(audit["Paper"]["retrieved"])
+            self.assertTrue(audit["Paper"]["in_window"])
+            self.assertFalse(audit["Invented"]["retrieved"])
+        finally:
+            os.unlink(temp_file)
+
 
 if __name__ == '__main__':
     unittest.main()
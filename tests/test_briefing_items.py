@@ -0,0 +1,84 @@
+import unittest
+import os
+import sys
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+from briefing_items import extract_urls, parse_items
+
+
+SAMPLE_BRIEFING = """# AI Research Briefing - January 13, 2026
+
+Summary paragraph with no links.
+
+## Last 24 Hours (Published within the last day)
+
+### High Priority (Score 9-10) - Read Today
+**[Faster OCR Transformers](https://arxiv.org/abs/2601.00001)**
+- **Link:** https://arxiv.org/abs/2601.00001
+- **Published:** January 13, 2026
+- **Score:** 9/10
+- **Why it matters:** Cuts inference cost.
+
+### On the Radar (Score 5-6) - Context Only
+- **Small Tool Release** ([link](https://github.com/example/tool)) - Minor update.
+
+## Last Week (Published in the past 7 days, excluding above)
+
+### Medium Priority (Score 7-8)
+**Weekly Item**
+- **Link:** [Blog post](https://example.com/blog).
+- **Score:** 7.5/10
+
+## Further Reading
+- [Deep dive](https://example.com/deep-dive)
+"""
+
+
+class TestBriefingItems(unittest.TestCase):
+    """Test cases for briefing item parsing."""
+
+    def test_extract_urls_strips_punctuation(self):
+        """Test URL extraction from markdown links and bare URLs."""
+        urls = extract_urls("See [x](https://a.com/x). Also https://b.com/y, and https://a.com/x")
+
+        self.assertEqual(urls, ["https://a.com/x", "https://b.com/y"])
+
+    def test_parse_items(self):
+        """Test that block, bullet and further-reading items are all found."""
+        items = parse_items(SAMPLE_BRIEFING)
+
+        self.assertEqual(len(items), 4)
+
+        first = items[0]
+        self.assertEqual(first["title"], "Faster OCR Transformers")
+        self.assertEqual(first["url"], "https://arxiv.org/abs/2601.00001")
+        self.assertEqual(first["score"], 9.0)
+        self.assertEqual(first["published"], "January 13, 2026")
+        self.assertEqual(first["section"], "24h")
+        self.assertEqual(first["tier"], "high")
+
+        self.assertEqual(items[1]["title"], "Small Tool Release")
+        self.assertEqual(items[1]["tier"], "radar")
+        self.assertIsNone(items[1]["score"])
+
+        self.assertEqual(items[2]["section"], "week")
+        self.assertEqual(items[2]["url"], "https://example.com/blog")
+        self.assertEqual(items[2]["score"], 7.5)
+
+        self.assertIsNone(items[3]["section"])
+        self.assertEqual(items[3]["title"], "Deep dive")
+
+    def test_item_line_ranges(self):
+        """Test that line ranges cover the title and all field bullets."""
+        lines = SAMPLE_BRIEFING.split("\n")
+        item = parse_items(SAMPLE_BRIEFING)[0]
+
+        block = lines[item["start"]:item["end"]]
+        self.assertTrue(block[0].startswith("**[Faster OCR"))
+        self.assertTrue(block[-1].startswith("- **Why it matters:**"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import os
+import sys
+import tempfile
+from datetime import date
+
+import boto3
+from moto import mock_aws
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+from briefing_store import BriefingStore
+
+
+def make_briefing(date_iso):
+    return {
+        "date": date_iso,
+        "date_iso": date_iso,
+        "briefing": f"Briefing for {date_iso}",
+        "timestamp": f"{date_iso}T11:00:00",
+        "model": "claude-sonnet-4-5-20250929"
+    }
+
+
+class TestBriefingStore(unittest.TestCase):
+    """Test cases for the local directory backend."""
+
+    def setUp(self):
+        """Set up a temporary archive directory."""
+        self.archive_dir = tempfile.TemporaryDirectory()
+        self.store = BriefingStore(directory=self.archive_dir.name)
+
+    def tearDown(self):
+        """Clean up the archive directory."""
+        self.archive_dir.cleanup()
+
+    def test_disabled_without_configuration(self):
+        """Test that the store is disabled when nothing is configured."""
+        self.assertFalse(BriefingStore().enabled)
+        self.assertTrue(self.store.enabled)
+
+    def test_save_and_load(self):
+        """Test storing and reloading a briefing by date."""
+        key = self.store.save(make_briefing("2026-01-13"))
+
+        self.assertEqual(key, "briefings/2026-01-13.json")
+        self.assertEqual(self.store.load("2026-01-13")["briefing"], "Briefing for 2026-01-13")
+        self.assertIsNone(self.store.load("2026-01-14"))
+
+    def test_date_key_falls_back_to_timestamp(self):
+        """Test that briefings without date_iso are keyed by their timestamp."""
+        briefing_data = make_briefing("2026-01-13")
+        del briefing_data["date_iso"]
+
+        self.assertEqual(BriefingStore.date_key(briefing_data), "2026-01-13")
+
+    def test_list_latest_and_range(self):
+        """Test listing dates, loading the latest and loading a range with gaps."""
+        for date_iso in ["2026-01-13", "2026-01-10", "2026-01-11"]:
+            self.store.save(make_briefing(date_iso))
+
+        self.assertEqual(self.store.list_dates(), ["2026-01-10", "2026-01-11", "2026-01-13"])
+        self.assertEqual(self.store.latest()["date_iso"], "2026-01-13")
+
+        briefings = self.store.load_range(date(2026, 1, 10), date(2026, 1, 12))
+        self.assertEqual([b["date_iso"] for b in briefings], ["2026-01-10", "2026-01-11"])
+
+    def test_state_round_trip(self):
+        """Test saving and loading named state."""
+        self.assertIsNone(self.store.load_state("weekly_digest"))
+
+        self.store.save_state("weekly_digest", {"dates": ["2026-01-13"]})
+
+        self.assertEqual(self.store.load_state("weekly_digest"), {"dates": ["2026-01-13"]})
+
+
+class TestBriefingStoreS3(unittest.TestCase):
+    """Test cases for the S3 backend."""
+
+    @mock_aws
+    def test_save_load_and_list(self):
+        """Test the S3 backend end to end."""
+        s3 = boto3.client('s3', region_name='us-east-1')
+        s3.create_bucket(Bucket='briefings-test')
+
+        store = BriefingStore(bucket='briefings-test')
+        store._s3 = s3
+        store.save(make_briefing("2026-01-12"))
+        store.save(make_briefing("2026-01-13"))
+
+        self.assertEqual(store.list_dates(), ["2026-01-12", "2026-01-13"])
+        self.assertEqual(store.latest()["date_iso"], "2026-01-13")
+        self.assertIsNone(store.load("2026-01-01"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+import os
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+from citations import extract_citations, parse_page_age, audit_links, apply_citation_audit
+
+
+SAMPLE_BRIEFING = """# AI Research Briefing - January 13, 2026
+
+## Last 24 Hours (Published within the last day)
+
+### High Priority (Score 9-10) - Read Today
+**Faster OCR Transformers**
+- **Link:** https://arxiv.org/abs/2601.00001
+- **Published:** January 13, 2026
+- **Score:** 9/10
+
+**Invented Item**
+- **Link:** https://example.com/never-searched
+- **Published:** January 13, 2026
+- **Score:** 9/10
+
+## Last Week (Published in the past 7 days, excluding above)
+
+### Medium Priority (Score 7-8)
+**Stale Item**
+- **Link:** https://www.example.com/old-post/
+- **Score:** 7/10
+
+## Further Reading
+- [Deep dive](https://example.com/deep-dive)
+"""
+
+REFERENCE = datetime(2026, 1, 13, 11, 0)
+
+
+def search_response():
+    """Content blocks shaped like a web_search response."""
+    return [
+        SimpleNamespace(type="server_tool_use", input={"query": "OCR transformer January 13 2026"}),
+        SimpleNamespace(type="web_search_tool_result", content=[
+            SimpleNamespace(type="web_search_result", url="https://arxiv.org/abs/2601.00001",
+                            title="Faster OCR Transformers", page_age="January 13, 2026"),
+            SimpleNamespace(type="web_search_result", url="https://example.com/old-post?utm_source=x",
+                            title="Old Post", page_age="3 weeks ago"),
+        ]),
+        SimpleNamespace(type="web_search_tool_result",
+                        content=SimpleNamespace(type="web_search_tool_result_error", error_code="unavailable")),
+        SimpleNamespace(type="text", text="# AI Research Briefing", citations=[
+            SimpleNamespace(url="https://arxiv.org/abs/2601.00001", cited_text="..."),
+        ]),
+    ]
+
+
+class TestCitations(unittest.TestCase):
+    """Test cases for the search citation table and link audit."""
+
+    def test_extract_citations(self):
+        """Test building the citation table from server tool blocks."""
+        citations = extract_citations(search_response())
+
+        self.assertEqual(citations["queries"], ["OCR transformer January 13 2026"])
+        self.assertEqual(len(citations["results"]), 2)
+        self.assertEqual(citations["results"][0], {
+            "url": "https://arxiv.org/abs/2601.00001",
+            "title": "Faster OCR Transformers",
+            "page_age": "January 13, 2026",
+            "cited": True,
+        })
+        self.assertFalse(citations["results"][1]["cited"])
+
+    def test_parse_page_age(self):
+        """Test absolute and relative page ages."""
+        self.assertEqual(parse_page_age("January 12, 2026", REFERENCE), datetime(2026, 1, 12))
+        self.assertEqual(parse_page_age("Jan. 12, 2026", REFERENCE), datetime(2026, 1, 12))
+        self.assertEqual(parse_page_age("2026-01-12T08:30:00Z", REFERENCE), datetime(2026, 1, 12, 8, 30))
+        self.assertEqual(parse_page_age("2 days ago", REFERENCE).date(), datetime(2026, 1, 11).date())
+        self.assertEqual(parse_page_age("yesterday", REFERENCE).date(), datetime(2026, 1, 12).date())
+        self.assertIsNone(parse_page_age("recently", REFERENCE))
+        self.assertIsNone(parse_page_age(None, REFERENCE))
+
+    def test_audit_links(self):
+        """Test joining briefing items against the citation table."""
+        findings = audit_links(SAMPLE_BRIEFING, extract_citations(search_response()), REFERENCE)
+        by_title = {finding["title"]: finding for finding in findings}
+
+        # Further Reading isn't date-bound, so it isn't audited
+        self.assertEqual(set(by_title), {"Faster OCR Transformers", "Invented Item", "Stale Item"})
+
+        self.assertTrue(by_title["Faster OCR Transformers"]["retrieved"])
+        self.assertTrue(by_title["Faster OCR Transformers"]["in_window"])
+
+        # Unretrieved items fall back to the briefing's own Published field
+        self.assertFalse(by_title["Invented Item"]["retrieved"])
+        self.assertEqual(by_title["Invented Item"]["published"], "2026-01-13")
+
+        self.assertTrue(by_title["Stale Item"]["retrieved"])
+        self.assertEqual(by_title["Stale Item"]["published"], "2025-12-23")
+        self.assertFalse(by_title["Stale Item"]["in_window"])
+
+    def test_apply_citation_audit_annotate(self):
+        """Test that unretrieved and stale items are flagged in place."""
+        briefing_data = {"briefing": SAMPLE_BRIEFING}
+        briefing_data["link_audit"] = audit_links(SAMPLE_BRIEFING, extract_citations(search_response()), REFERENCE)
+
+        result = apply_citation_audit(briefing_data, mode="annotate")
+
+        self.assertIn("never-searched ⚠️ *Link not found in this run's search results*", result["briefing"])
+        self.assertIn("old-post/ ⚠️ *Published 2025-12-23, outside this section's window*", result["briefing"])
+        self.assertNotIn("2601.00001 ⚠️", result["briefing"])
+
+    def test_apply_citation_audit_drop(self):
+        """Test that drop mode removes flagged items."""
+        briefing_data = {"briefing": SAMPLE_BRIEFING}
+        briefing_data["link_audit"] = audit_links(SAMPLE_BRIEFING, extract_citations(search_response()), REFERENCE)
+
+        result = apply_citation_audit(briefing_data, mode="drop")
+
+        self.assertIn("Faster OCR Transformers", result["briefing"])
+        self.assertNotIn("Invented Item", result["briefing"])
+        self.assertNotIn("Stale Item", result["briefing"])
+
+    def test_apply_citation_audit_off(self):
+        """Test that the audit can be disabled."""
+        briefing_data = {"briefing": SAMPLE_BRIEFING}
+        briefing_data["link_audit"] = audit_links(SAMPLE_BRIEFING, extract_citations(search_response()), REFERENCE)
+
+        result = apply_citation_audit(briefing_data, mode="off")
+
+        self.assertEqual(result["briefing"], SAMPLE_BRIEFING)
+
+
+if __name__ == '__main__':
+    unittest.main()
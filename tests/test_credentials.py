@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import json
+
+import boto3
+from moto import mock_aws
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+import credentials
+from credentials import get_anthropic_api_key, get_email_config, clear_cache
+
+
+ENV_KEYS = [
+    "ANTHROPIC_API_KEY", "ANTHROPIC_SECRET_ID", "SENDER_EMAIL", "RECIPIENT_EMAIL",
+    "SENDER_EMAIL_PARAM", "RECIPIENT_EMAIL_PARAM", "CREDENTIAL_CACHE_TTL", "AWS_DEFAULT_REGION",
+]
+
+
+@mock_aws
+class TestCredentials(unittest.TestCase):
+    """Test cases for the cached Secrets Manager/SSM credential provider."""
+
+    def setUp(self):
+        """Set up a mocked secret and parameters."""
+        self.saved_env = {key: os.environ.pop(key) for key in ENV_KEYS if key in os.environ}
+        os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+        clear_cache()
+
+        self.secrets = boto3.client('secretsmanager')
+        self.secret_arn = self.secrets.create_secret(
+            Name="daily-briefing/anthropic-api-key", SecretString="sk-original"
+        )["ARN"]
+
+        ssm = boto3.client('ssm')
+        ssm.put_parameter(Name="/daily-briefing/sender-email", Value="sender@example.com", Type="String")
+        ssm.put_parameter(Name="/daily-briefing/recipient-email", Value="recipient@example.com", Type="String")
+
+    def tearDown(self):
+        """Restore the environment and clear the cache."""
+        for key in ENV_KEYS:
+            os.environ.pop(key, None)
+        os.environ.update(self.saved_env)
+        clear_cache()
+
+    def test_env_fallback(self):
+        """Test that plain environment variables still work locally."""
+        os.environ["ANTHROPIC_API_KEY"] = "sk-env"
+        os.environ["SENDER_EMAIL"] = "a@example.com"
+        os.environ["RECIPIENT_EMAIL"] = "b@example.com"
+
+        self.assertEqual(get_anthropic_api_key(), "sk-env")
+        self.assertEqual(get_email_config(), ("a@example.com", "b@example.com"))
+
+    def test_secret_and_parameters(self):
+        """Test reading the key from Secrets Manager and emails from SSM."""
+        os.environ["ANTHROPIC_SECRET_ID"] = self.secret_arn
+        os.environ["SENDER_EMAIL_PARAM"] = "/daily-briefing/sender-email"
+        os.environ["RECIPIENT_EMAIL_PARAM"] = "/daily-briefing/recipient-email"
+
+        self.assertEqual(get_anthropic_api_key(), "sk-original")
+        self.assertEqual(get_email_config(), ("sender@example.com", "recipient@example.com"))
+
+    def test_json_secret(self):
+        """Test a JSON secret with an ANTHROPIC_API_KEY field."""
+        self.secrets.put_secret_value(
+            SecretId=self.secret_arn, SecretString=json.dumps({"ANTHROPIC_API_KEY": "sk-json"})
+        )
+        os.environ["ANTHROPIC_SECRET_ID"] = self.secret_arn
+
+        self.assertEqual(get_anthropic_api_key(), "sk-json")
+
+    def test_cache_avoids_round_trips(self):
+        """Test that warm calls are served from the cache."""
+        os.environ["ANTHROPIC_SECRET_ID"] = self.secret_arn
+        get_anthropic_api_key()
+
+        with patch.object(credentials, '_fetch_secret') as mock_fetch:
+            self.assertEqual(get_anthropic_api_key(), "sk-original")
+            mock_fetch.assert_not_called()
+
+    def test_rotation_picked_up_after_ttl(self):
+        """Test that a rotated secret is seen once the cached value expires."""
+        os.environ["ANTHROPIC_SECRET_ID"] = self.secret_arn
+        self.assertEqual(get_anthropic_api_key(), "sk-original")
+
+        self.secrets.put_secret_value(SecretId=self.secret_arn, SecretString="sk-rotated")
+        self.assertEqual(get_anthropic_api_key(), "sk-original")
+
+        os.environ["CREDENTIAL_CACHE_TTL"] = "0"
+        self.assertEqual(get_anthropic_api_key(), "sk-rotated")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import unittest
+from unittest.mock import Mock
+import os
+import sys
+import shutil
+import tempfile
+from datetime import datetime
+from types import SimpleNamespace
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+from briefing_generator import BriefingGenerator
+from briefing_store import BriefingStore
+from citations import audit_links, extract_citations
+from delta_scan import DELTA_PROMPT_FILE, NO_NEW_ITEMS, run_delta_scan, select_alert_items
+
+
+MORNING_BRIEFING = """# AI Research Briefing - January 13, 2026
+
+## Last 24 Hours (Published within the last day)
+
+### High Priority (Score 9-10) - Read Today
+**Faster OCR Transformers**
+- **Link:** https://arxiv.org/abs/2601.00001
+- **Published:** January 13, 2026
+- **Score:** 9/10
+"""
+
+SCAN_OUTPUT = """## Last 24 Hours
+
+### High Priority (Score 9-10) - Read Today
+**Major Model Release**
+- **Link:** https://example.com/release
+- **Published:** January 13, 2026
+- **Score:** 10/10
+- **Why it matters:** Changes what we recommend this week.
+
+**Faster OCR Transformers**
+- **Link:** https://arxiv.org/abs/2601.00001
+- **Published:** January 13, 2026
+- **Score:** 9/10
+
+**Invented Release**
+- **Link:** https://example.com/invented
+- **Published:** January 13, 2026
+- **Score:** 9/10
+
+**Minor Update**
+- **Link:** https://example.com/minor
+- **Published:** January 13, 2026
+- **Score:** 8/10
+"""
+
+NOW = datetime(2026, 1, 13, 15, 0)
+
+
+def scan_response(text):
+    """A response with one search returning the release, OCR and minor-update pages."""
+    return SimpleNamespace(
+        content=[
+            SimpleNamespace(type="server_tool_use", input={"query": "AI release January 13 2026"}),
+            SimpleNamespace(type="web_search_tool_result", content=[
+                SimpleNamespace(url=url, title="Result", page_age="2 hours ago")
+                for url in ("https://example.com/release", "https://arxiv.org/abs/2601.00001",
+                            "https://example.com/minor")
+            ]),
+            SimpleNamespace(type="text", text=text, citations=None),
+        ],
+        usage=SimpleNamespace(input_tokens=8000, output_tokens=300,
+                              server_tool_use=SimpleNamespace(web_search_requests=2)),
+    )
+
+
+class TestDeltaScan(unittest.TestCase):
+    """Test cases for intraday delta scans."""
+
+    def setUp(self):
+        """Set up a local store holding the morning briefing."""
+        self.directory = tempfile.mkdtemp()
+        self.store = BriefingStore(directory=self.directory)
+        self.store.save({
+            "date_iso": "2026-01-13",
+            "briefing": MORNING_BRIEFING,
+            "usage": {"input_tokens": 150000, "output_tokens": 12000, "web_search_requests": 20},
+            "model": "claude-sonnet-4-5-20250929",
+            "timestamp": "2026-01-13T11:05:00",
+        })
+        self.client = Mock()
+        self.generator = BriefingGenerator(prompt_file=DELTA_PROMPT_FILE, client=self.client, stream=False)
+
+    def tearDown(self):
+        """Remove the local store."""
+        shutil.rmtree(self.directory)
+
+    def test_select_alert_items(self):
+        """Test that only uncovered, retrieved items scoring 9-10 are alerted on."""
+        covered = [{"title": "Faster OCR Transformers", "url": "https://arxiv.org/abs/2601.00001"}]
+        link_audit = audit_links(SCAN_OUTPUT, extract_citations(scan_response(SCAN_OUTPUT).content), NOW)
+
+        items = select_alert_items(SCAN_OUTPUT, covered, link_audit)
+
+        self.assertEqual([item["title"] for item in items], ["Major Model Release"])
+        self.assertEqual(select_alert_items(NO_NEW_ITEMS, covered, link_audit), [])
+
+    def test_item_without_link_never_alerts(self):
+        """Test that a high-scoring item with no link line can't trigger an alert."""
+        self.client.messages.create.return_value = scan_response("""## Last 24 Hours
+
+### High Priority (Score 9-10) - Read Today
+**Rumored GPT-6 Launch**
+- **Published:** January 13, 2026
+- **Score:** 10/10
+- **Why it matters:** Everyone is talking about it.
+""")
+
+        result = run_delta_scan(self.generator, self.store, now=NOW)
+
+        self.assertFalse(result["alert"])
+        self.assertEqual(result["alert_items"], [])
+
+    def test_scan_request_is_small(self):
+        """Test that the scan uses a small search budget, no thinking, and the covered context."""
+        self.client.messages.create.return_value = scan_response(NO_NEW_ITEMS)
+
+        run_delta_scan(self.generator, self.store, now=NOW)
+
+        request = self.client.messages.create.call_args[1]
+        self.assertNotIn("thinking", request)
+        self.assertEqual(request["tools"][0]["max_uses"], 3)
+        self.assertLessEqual(request["max_tokens"], 2048)
+        prompt = request["messages"][0]["content"]
+        self.assertIn("Faster OCR Transformers (https://arxiv.org/abs/2601.00001)", prompt)
+        self.assertIn("since January 13, 2026 11:05", prompt)
+
+    def test_no_new_items(self):
+        """Test that a quiet hour produces no alert but still records the run."""
+        self.client.messages.create.return_value = scan_response(NO_NEW_ITEMS)
+
+        result = run_delta_scan(self.generator, self.store, now=NOW)
+
+        self.assertFalse(result["alert"])
+        state = self.store.load_state("delta_scan")
+        self.assertEqual(state["last_run"], NOW.isoformat())
+        self.assertEqual(len(state["runs"]), 1)
+        self.assertEqual(state["runs"][0]["alerts"], 0)
+
+    def test_alert_and_cost_metrics(self):
+        """Test the alert contents and the recorded cost against the daily run."""
+        self.client.messages.create.return_value = scan_response(SCAN_OUTPUT)
+
+        result = run_delta_scan(self.generator, self.store, now=NOW)
+
+        self.assertTrue(result["alert"])
+        # Covered, unretrieved and sub-9 items are all left out
+        self.assertEqual([item["title"] for item in result["alert_items"]], ["Major Model Release"])
+        self.assertIn("**Major Model Release**", result["briefing"])
+        self.assertNotIn("Invented Release", result["briefing"])
+        self.assertTrue(result["briefing"].startswith("# AI Research Alert - January 13, 2026 15:00"))
+
+        metrics = result["metrics"]
+        self.assertAlmostEqual(metrics["cost_usd"], 0.0295)
+        self.assertAlmostEqual(metrics["daily_cost_usd"], 0.83)
+        self.assertLess(metrics["fraction_of_daily"], 0.05)
+        self.assertTrue(metrics["within_target"])
+
+    def test_first_scan_of_day_starts_from_briefing(self):
+        """Test that last evening's scan doesn't widen the window past the morning briefing."""
+        self.store.save_state("delta_scan", {"last_run": "2026-01-12T23:00:00"})
+        self.client.messages.create.return_value = scan_response(NO_NEW_ITEMS)
+
+        run_delta_scan(self.generator, self.store, now=datetime(2026, 1, 13, 12, 0))
+
+        prompt = self.client.messages.create.call_args[1]["messages"][0]["content"]
+        self.assertIn("since January 13, 2026 11:05", prompt)
+
+    def test_alerted_items_not_repeated(self):
+        """Test that the next scan treats earlier alerts as covered and scans from the last run."""
+        self.client.messages.create.return_value = scan_response(SCAN_OUTPUT)
+        run_delta_scan(self.generator, self.store, now=NOW)
+
+        result = run_delta_scan(self.generator, self.store, now=datetime(2026, 1, 13, 16, 0))
+
+        self.assertFalse(result["alert"])
+        prompt = self.client.messages.create.call_args[1]["messages"][0]["content"]
+        self.assertIn("Major Model Release", prompt)
+        self.assertIn("since January 13, 2026 15:00", prompt)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import unittest
+from unittest.mock import Mock, patch
+import os
+import sys
+import json
+import tempfile
+from datetime import date, datetime, timedelta
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+from evaluation import RecordingClient, RecordedClient, briefing_metrics, run_evaluation, format_report, main
+
+
+BRIEFING_TEXT = """Let me search for the latest news.
+# AI Research Briefing - {date}
+
+## Last 24 Hours (Published within the last day)
+
+### High Priority (Score 9-10) - Read Today
+**Faster OCR Transformers**
+- **Link:** https://arxiv.org/abs/2601.00001
+- **Score:** 9/10
+
+### On the Radar (Score 5-6) - Context Only
+- **Small Tool** (https://github.com/example/tool) - Minor update.
+- Now let me look at more sources.
+"""
+
+
+def recorded_response(text):
+    return {
+        "content": [
+            {"type": "thinking", "thinking": "Planning the briefing", "signature": "sig"},
+            {"type": "text", "text": text},
+        ],
+        "usage": {
+            "input_tokens": 20000,
+            "output_tokens": 4000,
+            "server_tool_use": {"web_search_requests": 5},
+        },
+    }
+
+
+class TestEvaluation(unittest.TestCase):
+    """Test cases for the backfill and prompt A/B evaluation runner."""
+
+    def setUp(self):
+        """Set up prompt variants and scratch directories."""
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.recordings = os.path.join(self.work_dir.name, "recordings")
+        self.output = os.path.join(self.work_dir.name, "runs")
+
+        self.variants = {}
+        for name, extra in [("baseline", ""), ("terse", " Be brief.")]:
+            path = os.path.join(self.work_dir.name, f"{name}.md")
+            with open(path, 'w') as f:
+                f.write(f"Create a briefing for {{date}}.{extra}")
+            self.variants[name] = path
+
+        self.days = [datetime(2026, 1, 12), datetime(2026, 1, 13)]
+
+    def tearDown(self):
+        """Clean up scratch directories."""
+        self.work_dir.cleanup()
+
+    def _record_all(self):
+        """Record one response per (variant, day) through RecordingClient."""
+        live_client = Mock()
+
+        def create(**kwargs):
+            prompt = kwargs["messages"][0]["content"]
+            date = prompt.split("for ")[1].split(".")[0]
+            response = Mock()
+            response.model_dump.return_value = recorded_response(BRIEFING_TEXT.format(date=date))
+            return response
+
+        live_client.messages.create.side_effect = create
+        recording_client = RecordingClient(live_client, self.recordings)
+        for prompt_file in self.variants.values():
+            for day in self.days:
+                prompt = open(prompt_file).read().format(date=day.strftime("%B %d, %Y"))
+                recording_client.messages.create(
+                    model="claude-sonnet-4-5-20250929",
+                    messages=[{"role": "user", "content": prompt}]
+                )
+
+    def test_recorded_client_missing_response(self):
+        """Test that replaying an unrecorded request fails clearly."""
+        client = RecordedClient(self.recordings)
+
+        with self.assertRaises(FileNotFoundError) as context:
+            client.messages.create(model="x", messages=[])
+
+        self.assertIn("No recorded response", str(context.exception))
+
+    def test_briefing_metrics(self):
+        """Test metrics computed for one briefing."""
+        briefing_data = {
+            "briefing": BRIEFING_TEXT.format(date="January 13, 2026"),
+            "narration_filtered": 2,
+            "usage": {"input_tokens": 1_000_000, "output_tokens": 100_000, "web_search_requests": 10},
+            "model": "claude-sonnet-4-5-20250929",
+        }
+
+        metrics = briefing_metrics(briefing_data)
+
+        self.assertEqual(metrics["items"], 2)
+        self.assertEqual(metrics["items_per_tier"], {"high": 1, "medium": 0, "radar": 1})
+        self.assertEqual(metrics["links"], 2)
+        self.assertEqual(metrics["narration_filtered"], 2)
+        # $3 input + $1.50 output + $0.10 search
+        self.assertAlmostEqual(metrics["cost_usd"], 4.6)
+
+    def test_run_evaluation_offline(self):
+        """Test a full offline A/B backfill against recorded responses."""
+        self._record_all()
+
+        report = run_evaluation(RecordedClient(self.recordings), self.variants, self.days,
+                                self.output, concurrency=3)
+
+        self.assertEqual(len(report["runs"]), 4)
+        for name in self.variants:
+            summary = report["variants"][name]
+            self.assertEqual(summary["runs"], 2)
+            self.assertEqual(summary["errors"], 0)
+            self.assertEqual(summary["mean_items_per_tier"]["high"], 1)
+            self.assertEqual(summary["input_tokens"], 40000)
+            # The narration line inside the radar section is filtered in every run
+            self.assertEqual(summary["narration_filtered"], 2)
+
+        saved_path = os.path.join(self.output, "terse", "2026-01-13.json")
+        with open(saved_path, 'r') as f:
+            saved = json.load(f)
+        self.assertTrue(saved["briefing"]["briefing"].startswith("# AI Research Briefing - January 13, 2026"))
+        self.assertIn("latency_seconds", saved["run"])
+        self.assertIn("usage", saved["briefing"])
+
+        self.assertTrue(os.path.exists(os.path.join(self.output, "report.json")))
+        self.assertIn("baseline", format_report(report))
+
+    def test_run_evaluation_records_errors(self):
+        """Test that a failing run is reported without stopping the others."""
+        report = run_evaluation(RecordedClient(self.recordings), {"baseline": self.variants["baseline"]},
+                                self.days[:1], self.output, concurrency=1)
+
+        self.assertEqual(report["variants"]["baseline"]["errors"], 1)
+        self.assertIn("error", report["runs"][0])
+
+    def test_main_date_range(self):
+        """Test that --end alone runs from today, and an end before the start is rejected."""
+        end = date.today() + timedelta(days=2)
+        report = {"runs": [], "variants": {}}
+        with patch('evaluation.run_evaluation', return_value=report) as mock_run, \
+                patch('evaluation.format_report', return_value=""):
+            main(["--end", end.isoformat(), "--replay", self.recordings, "--output", self.output])
+
+        days = mock_run.call_args[0][2]
+        self.assertEqual([day.date() for day in days],
+                         [date.today() + timedelta(days=offset) for offset in range(3)])
+
+        with patch('sys.stderr'), self.assertRaises(SystemExit):
+            main(["--start", "2026-01-13", "--end", "2026-01-12", "--replay", self.recordings])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -79,6 +79,68 @@ class TestHandler(unittest.TestCase):
         # Verify error notification was attempted
         mock_send_error.assert_called_once()
 
+    @patch('handler.send_email')
+    @patch('handler.build_weekly_digest')
+    @patch('handler.BriefingStore')
+    def test_handler_weekly_digest(self, mock_store_class, mock_build_digest, mock_send_email):
+        """Test that the weekly digest mode builds from the store without research."""
+        mock_store_class.return_value = Mock(enabled=True)
+        mock_build_digest.return_value = {
+            "title": "Weekly Digest",
+            "date": "January 07 - January 13, 2026",
+            "briefing": "Digest content",
+            "item_count": 4,
+            "source_dates": ["2026-01-12", "2026-01-13"],
+            "timestamp": "2026-01-13T08:00:00",
+            "model": "n/a"
+        }
+        mock_send_email.return_value = {"success": True, "message_id": "test-123"}
+
+        result = handler({"mode": "weekly_digest", "summarize": False}, None)
+
+        self.assertEqual(result["statusCode"], 200)
+        body = json.loads(result["body"])
+        self.assertEqual(body["items"], 4)
+        mock_build_digest.assert_called_once_with(mock_store_class.return_value, client=None)
+        mock_send_email.assert_called_once_with(mock_build_digest.return_value)
+
+    @patch('handler.send_email')
+    @patch('handler.run_delta_scan')
+    @patch('handler.BriefingGenerator')
+    @patch('handler.BriefingStore')
+    def test_handler_delta_scan(self, mock_store_class, mock_generator_class, mock_run_delta_scan,
+                                mock_send_email):
+        """Test that the delta mode only emails when the scan finds something."""
+        mock_store_class.return_value = Mock(enabled=True)
+        mock_run_delta_scan.return_value = {
+            "title": "AI Research Alert",
+            "date": "January 13, 2026 15:00",
+            "briefing": "",
+            "alert": False,
+            "alert_items": [],
+            "metrics": {"cost_usd": 0.03, "latency_seconds": 12.5, "within_target": True},
+            "timestamp": "2026-01-13T15:00:00",
+            "model": "claude-haiku-4-5-20251001"
+        }
+
+        result = handler({"mode": "delta"}, None)
+
+        self.assertEqual(result["statusCode"], 200)
+        body = json.loads(result["body"])
+        self.assertFalse(body["email_sent"])
+        self.assertEqual(body["metrics"]["cost_usd"], 0.03)
+        mock_send_email.assert_not_called()
+
+        mock_run_delta_scan.return_value = dict(
+            mock_run_delta_scan.return_value, alert=True, alert_items=[{"title": "Major Model Release"}]
+        )
+        mock_send_email.return_value = {"success": True, "message_id": "test-123"}
+
+        result = handler({"mode": "delta"}, None)
+
+        self.assertTrue(json.loads(result["body"])["email_sent"])
+        mock_send_email.assert_called_once_with(mock_run_delta_scan.return_value)
+
     @patch('handler.boto3.client')
     def test_send_email_success(self, mock_boto_client):
         """Test successful email sending."""
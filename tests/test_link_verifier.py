@@ -0,0 +1,261 @@
+import unittest
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+from unittest.mock import MagicMock, patch
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import httpx
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+from link_verifier import LinkVerifier, VerdictCache, apply_verdicts, verify_briefing_links
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Local HTTP stand-in for the sites a briefing links to."""
+
+    requests_seen = []
+
+    def _respond(self, send_body):
+        StandInHandler.requests_seen.append((self.command, self.path))
+        if self.path == "/ok":
+            status = 200
+        elif self.path == "/no-head" and self.command == "HEAD":
+            status = 405
+        elif self.path == "/no-head":
+            status = 200
+        elif self.path == "/paywall":
+            status = 403
+        elif self.path == "/slow":
+            time.sleep(2)
+            status = 200
+        else:
+            status = 404
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(b"ok")
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestLinkVerifier(unittest.TestCase):
+    """Test cases for the link verifier against a local HTTP server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Set up a fresh verdict cache for each test."""
+        StandInHandler.requests_seen = []
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.cache_dir.name, "verdicts.json")
+
+    def tearDown(self):
+        """Clean up the cache directory."""
+        self.cache_dir.cleanup()
+
+    def test_verify_classifies_statuses(self):
+        """Test that live, paywalled and missing pages get the right verdicts."""
+        verifier = LinkVerifier(cache=VerdictCache(self.cache_path))
+        verdicts = verifier.verify([
+            f"{self.base_url}/ok",
+            f"{self.base_url}/no-head",
+            f"{self.base_url}/paywall",
+            f"{self.base_url}/missing",
+        ])
+
+        self.assertTrue(verdicts[f"{self.base_url}/ok"]["ok"])
+        self.assertTrue(verdicts[f"{self.base_url}/no-head"]["ok"])
+        self.assertTrue(verdicts[f"{self.base_url}/paywall"]["ok"])
+        self.assertFalse(verdicts[f"{self.base_url}/missing"]["ok"])
+        self.assertEqual(verdicts[f"{self.base_url}/missing"]["status"], 404)
+
+    def test_verify_unreachable_host(self):
+        """Test that a host nobody listens on is reported as dead."""
+        url = "http://127.0.0.1:1/nothing"
+        verifier = LinkVerifier(cache=VerdictCache(self.cache_path))
+        verdicts = verifier.verify([url])
+
+        self.assertFalse(verdicts[url]["ok"])
+
+    def test_unexpected_error_is_inconclusive(self):
+        """Test that an unexpected exception for one URL doesn't abort the others."""
+        good_url = f"{self.base_url}/ok"
+        bad_url = "https://localhost:99999/"
+        verifier = LinkVerifier(cache=VerdictCache(self.cache_path))
+
+        original_head = httpx.AsyncClient.head
+
+        async def head(client, url, **kwargs):
+            if url == bad_url:
+                raise ExceptionGroup("transport failed", [OSError("bad port")])
+            return await original_head(client, url, **kwargs)
+
+        with patch.object(httpx.AsyncClient, 'head', head):
+            verdicts = verifier.verify([good_url, bad_url])
+
+        self.assertTrue(verdicts[good_url]["ok"])
+        self.assertIsNone(verdicts[bad_url]["ok"])
+        self.assertIn("ExceptionGroup", verdicts[bad_url]["reason"])
+
+    def test_verify_respects_time_budget(self):
+        """Test that checks still running when the budget expires are inconclusive."""
+        verifier = LinkVerifier(cache=VerdictCache(self.cache_path), time_budget=0.5)
+
+        start = time.monotonic()
+        verdicts = verifier.verify([f"{self.base_url}/slow", f"{self.base_url}/ok"])
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1.5)
+        self.assertIsNone(verdicts[f"{self.base_url}/slow"]["ok"])
+        self.assertTrue(verdicts[f"{self.base_url}/ok"]["ok"])
+
+    def test_verdicts_cached_across_runs(self):
+        """Test that a second run reuses cached verdicts instead of refetching."""
+        url = f"{self.base_url}/missing"
+        LinkVerifier(cache=VerdictCache(self.cache_path)).verify([url])
+        requests_after_first_run = len(StandInHandler.requests_seen)
+
+        verdicts = LinkVerifier(cache=VerdictCache(self.cache_path)).verify([url])
+
+        self.assertEqual(len(StandInHandler.requests_seen), requests_after_first_run)
+        self.assertTrue(verdicts[url]["cached"])
+        self.assertFalse(verdicts[url]["ok"])
+
+    def test_expired_verdicts_are_refetched(self):
+        """Test that verdicts older than the TTL are ignored."""
+        url = f"{self.base_url}/ok"
+        with open(self.cache_path, 'w') as f:
+            json.dump({url: {"ok": False, "status": 404, "reason": "HTTP 404",
+                             "checked_at": time.time() - 3600}}, f)
+
+        verdicts = LinkVerifier(cache=VerdictCache(self.cache_path, ttl=60)).verify([url])
+
+        self.assertTrue(verdicts[url]["ok"])
+        self.assertNotIn("cached", verdicts[url])
+
+
+class TestApplyVerdicts(unittest.TestCase):
+    """Test cases for annotating and dropping failing briefing items."""
+
+    def setUp(self):
+        """Set up a briefing with one good and one dead item."""
+        self.briefing = """# AI Research Briefing - January 13, 2026
+
+## Last 24 Hours (Published within the last day)
+
+### High Priority (Score 9-10) - Read Today
+**Good Paper**
+- **Link:** https://example.com/good
+- **Score:** 9/10
+
+**Dead Paper**
+- **Link:** https://example.com/dead
+- **Score:** 9/10
+
+### On the Radar (Score 5-6) - Context Only
+- **Radar Item** (https://example.com/radar) - Summary"""
+        self.verdicts = {
+            "https://example.com/good": {"ok": True, "status": 200, "reason": "HTTP 200"},
+            "https://example.com/dead": {"ok": False, "status": 404, "reason": "HTTP 404"},
+            "https://example.com/radar": {"ok": None, "status": None, "reason": "timed out"},
+        }
+
+    def test_annotate_failing_item(self):
+        """Test that failing items are annotated on their link line."""
+        result = apply_verdicts(self.briefing, self.verdicts, mode="annotate")
+
+        self.assertIn("https://example.com/dead ⚠️ *Link could not be verified (HTTP 404)*", result["briefing"])
+        self.assertIn("**Good Paper**", result["briefing"])
+        self.assertEqual(len(result["failed"]), 1)
+        self.assertEqual(result["failed"][0]["title"], "Dead Paper")
+
+    def test_drop_failing_item(self):
+        """Test that drop mode removes the whole failing item."""
+        result = apply_verdicts(self.briefing, self.verdicts, mode="drop")
+
+        self.assertNotIn("Dead Paper", result["briefing"])
+        self.assertNotIn("https://example.com/dead", result["briefing"])
+        self.assertIn("Good Paper", result["briefing"])
+        # Inconclusive checks leave the item alone
+        self.assertIn("Radar Item", result["briefing"])
+
+    def test_headings_outside_item_sections_left_alone(self):
+        """Test that bold headings without links outside the item sections aren't flagged."""
+        briefing = """**Executive Summary**
+A summary paragraph.
+
+""" + self.briefing + """
+
+## Upcoming Events
+**NeurIPS Workshop on Document AI**
+- December 10, 2026, Vancouver
+
+**Bottom Line**
+Act on the OCR result this week."""
+
+        for mode in ("annotate", "drop"):
+            result = apply_verdicts(briefing, self.verdicts, mode=mode)
+
+            self.assertNotIn("no source link", result["briefing"])
+            self.assertIn("**Executive Summary**", result["briefing"])
+            self.assertIn("- December 10, 2026, Vancouver", result["briefing"])
+            self.assertIn("**Bottom Line**", result["briefing"])
+            self.assertEqual([item["title"] for item in result["failed"]], ["Dead Paper"])
+
+    def test_verify_briefing_links_off(self):
+        """Test that link checking can be disabled."""
+        briefing_data = {"briefing": self.briefing}
+
+        result = verify_briefing_links(briefing_data, mode="off")
+
+        self.assertEqual(result["briefing"], self.briefing)
+        self.assertNotIn("link_check", result)
+
+    def test_search_results_skip_http_check(self):
+        """Test that links returned by web search aren't fetched again."""
+        briefing_data = {
+            "briefing": self.briefing,
+            "citations": {"results": [
+                {"url": "https://www.example.com/good/", "title": "Good", "page_age": None, "cited": False},
+            ]},
+        }
+        verifier = MagicMock()
+        verifier.verify.return_value = {
+            "https://example.com/dead": self.verdicts["https://example.com/dead"],
+            "https://example.com/radar": self.verdicts["https://example.com/radar"],
+        }
+
+        result = verify_briefing_links(briefing_data, mode="annotate", verifier=verifier)
+
+        verifier.verify.assert_called_once_with(["https://example.com/dead", "https://example.com/radar"])
+        self.assertEqual(result["link_check"]["from_search"], 1)
+        self.assertEqual(result["link_check"]["checked"], 2)
+        self.assertEqual(len(result["link_check"]["failed"]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+from unittest.mock import Mock, patch
+import io
+import os
+import sys
+import json
+import tempfile
+from contextlib import redirect_stdout
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+from tracing import trace, span, profile, profiler_mode
+from handler import handler
+
+
+def read_records(path):
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f]
+
+
+class TestTracing(unittest.TestCase):
+    """Test cases for spans, exporters and profiling hooks."""
+
+    def setUp(self):
+        """Set up a temporary trace file."""
+        self.trace_dir = tempfile.TemporaryDirectory()
+        self.trace_path = os.path.join(self.trace_dir.name, "traces.jsonl")
+
+    def tearDown(self):
+        """Clean up the trace file."""
+        self.trace_dir.cleanup()
+
+    def test_spans_exported_to_file(self):
+        """Test nested spans, attributes and metrics in the file exporter."""
+        with trace(exporter="file", path=self.trace_path, mode="daily"):
+            with span("outer", stage_kind="test"):
+                with span("inner") as inner:
+                    inner.metric("TimeToFirstToken", 12.5, "Milliseconds")
+
+        records = read_records(self.trace_path)
+        self.assertEqual([r["name"] for r in records], ["inner", "outer"])
+        inner_record, outer_record = records
+        self.assertEqual(inner_record["parent"], "outer")
+        self.assertEqual(inner_record["metrics"]["TimeToFirstToken"]["value"], 12.5)
+        self.assertEqual(outer_record["attributes"]["stage_kind"], "test")
+        self.assertEqual(outer_record["mode"], "daily")
+        self.assertEqual(inner_record["trace_id"], outer_record["trace_id"])
+        self.assertGreaterEqual(outer_record["duration_ms"], inner_record["duration_ms"])
+
+    def test_span_records_errors(self):
+        """Test that a failing stage is recorded with its error and still raises."""
+        with self.assertRaises(ValueError):
+            with trace(exporter="file", path=self.trace_path):
+                with span("failing"):
+                    raise ValueError("boom")
+
+        record = read_records(self.trace_path)[0]
+        self.assertEqual(record["error"], "ValueError: boom")
+
+    def test_span_without_trace_is_noop(self):
+        """Test that spans outside a trace can still be used."""
+        with span("untraced") as current:
+            current.set("key", "value")
+
+        self.assertEqual(current.attributes["key"], "value")
+
+    def test_emf_export(self):
+        """Test that the EMF exporter prints CloudWatch metric records."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            with trace(exporter="emf"):
+                with span("model") as model_span:
+                    model_span.metric("InputTokens", 1200, "Count")
+
+        record = json.loads(output.getvalue().strip())
+        directive = record["_aws"]["CloudWatchMetrics"][0]
+        self.assertEqual(directive["Namespace"], "DailyBriefing")
+        self.assertEqual(directive["Dimensions"], [["Stage"]])
+        self.assertIn({"Name": "Duration", "Unit": "Milliseconds"}, directive["Metrics"])
+        self.assertIn({"Name": "InputTokens", "Unit": "Count"}, directive["Metrics"])
+        self.assertEqual(record["Stage"], "model")
+        self.assertEqual(record["InputTokens"], 1200)
+
+    def test_profilers(self):
+        """Test that both profilers attach their results to the trace."""
+        for mode in ("cprofile", "tracemalloc"):
+            with trace(exporter="file", path=self.trace_path):
+                with profile(mode):
+                    sorted(str(i) for i in range(1000))
+
+        profiles = [r for r in read_records(self.trace_path) if r["type"] == "profile"]
+        self.assertEqual([p["profiler"] for p in profiles], ["cprofile", "tracemalloc"])
+        self.assertIn("cumulative", profiles[0]["stats"])
+        self.assertIn("peak_bytes", profiles[1])
+
+    @patch.dict(os.environ, {"PROFILE_SAMPLE_RATE": "0"})
+    def test_profiler_mode(self):
+        """Test that profiling is opt-in from the event."""
+        self.assertEqual(profiler_mode({"profile": "tracemalloc"}), "tracemalloc")
+        self.assertIsNone(profiler_mode({}))
+
+        with patch.dict(os.environ, {"PROFILE_SAMPLE_RATE": "1"}):
+            self.assertEqual(profiler_mode({}), "cprofile")
+
+
+class TestHandlerTracing(unittest.TestCase):
+    """Test cases for the stages traced by the handler."""
+
+    def setUp(self):
+        """Set up environment and a temporary trace file."""
+        self.trace_dir = tempfile.TemporaryDirectory()
+        self.trace_path = os.path.join(self.trace_dir.name, "traces.jsonl")
+        os.environ["TRACE_EXPORTER"] = "file"
+        os.environ["TRACE_FILE"] = self.trace_path
+        os.environ["ANTHROPIC_API_KEY"] = "test-api-key"
+
+    def tearDown(self):
+        """Clean up environment and trace file."""
+        for key in ["TRACE_EXPORTER", "TRACE_FILE", "ANTHROPIC_API_KEY"]:
+            os.environ.pop(key, None)
+        self.trace_dir.cleanup()
+
+    @patch('handler.send_email')
+    @patch('handler.BriefingGenerator')
+    def test_handler_traces_stages_and_profiles(self, mock_generator_class, mock_send_email):
+        """Test that a daily run records each stage and honours the profile switch."""
+        mock_generator = Mock()
+        mock_generator.generate_briefing.return_value = {
+            "date": "January 13, 2026",
+            "briefing": "Test briefing content",
+            "timestamp": "2026-01-13T08:00:00",
+            "model": "claude-sonnet-4-5-20250929"
+        }
+        mock_generator_class.return_value = mock_generator
+        mock_send_email.return_value = {"success": True, "message_id": "test-123"}
+
+        result = handler({"profile": "tracemalloc", "stream": True}, None)
+
+        self.assertEqual(result["statusCode"], 200)
+        mock_generator_class.assert_called_once_with(stream=True)
+
+        records = read_records(self.trace_path)
+        stages = [r["name"] for r in records if r["type"] == "span"]
+        self.assertEqual(stages, ["generate", "link_check", "handler"])
+        handler_record = next(r for r in records if r.get("name") == "handler")
+        self.assertEqual(handler_record["attributes"]["status_code"], 200)
+        self.assertTrue(any(r["type"] == "profile" for r in records))
+
+
+if __name__ == '__main__':
+    unittest.main()
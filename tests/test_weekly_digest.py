@@ -0,0 +1,226 @@
+import unittest
+from unittest.mock import Mock, patch
+import os
+import sys
+import tempfile
+from datetime import date
+
+# Add lambda directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'lambda'))
+
+from briefing_store import BriefingStore
+from weekly_digest import WeeklyDigest, build_weekly_digest, update_weekly_digest, normalize_url, normalize_title
+
+
+MONDAY_BRIEFING = """# AI Research Briefing - January 12, 2026
+
+## Last 24 Hours (Published within the last day)
+
+### High Priority (Score 9-10) - Read Today
+**Faster OCR Transformers**
+- **Link:** https://arxiv.org/abs/2601.00001
+- **Published:** January 12, 2026
+- **Score:** 9/10
+
+### Medium Priority (Score 7-8) - Review This Week
+**New MLOps Release**
+- **Link:** https://example.com/mlops?utm_source=newsletter
+- **Score:** 7/10
+
+## Further Reading
+- [Unrelated deep dive](https://example.com/deep-dive)
+"""
+
+TUESDAY_BRIEFING = """# AI Research Briefing - January 13, 2026
+
+## Last Week (Published in the past 7 days, excluding above)
+
+### High Priority (Score 9-10)
+**New MLOps release!**
+- **Link:** https://www.example.com/mlops/
+- **Score:** 9.5/10
+
+### Medium Priority (Score 7-8)
+**Faster OCR Transformers**
+- **Link:** https://arxiv.org/abs/2601.00001
+- **Score:** 8/10
+
+### Notable Developments (Score 5-6)
+- **Small Tool** (https://github.com/example/tool) - Minor update.
+"""
+
+
+def make_briefing(date_iso, briefing):
+    return {
+        "date": date_iso,
+        "date_iso": date_iso,
+        "briefing": briefing,
+        "timestamp": f"{date_iso}T11:00:00",
+        "model": "claude-sonnet-4-5-20250929"
+    }
+
+
+class TestWeeklyDigest(unittest.TestCase):
+    """Test cases for merging daily briefings into a weekly digest."""
+
+    def test_normalization(self):
+        """Test URL and title normalization used for deduplication."""
+        self.assertEqual(
+            normalize_url("http://WWW.Example.com/mlops/?utm_source=x&id=3#top"),
+            "https://example.com/mlops?id=3"
+        )
+        self.assertEqual(normalize_title("New MLOps release!"), "new mlops release")
+
+    def test_merge_dedupes_and_keeps_max_score(self):
+        """Test that duplicate items merge across days with the max score."""
+        digest = WeeklyDigest()
+        digest.add_briefing(make_briefing("2026-01-12", MONDAY_BRIEFING), "2026-01-12")
+        digest.add_briefing(make_briefing("2026-01-13", TUESDAY_BRIEFING), "2026-01-13")
+
+        items = digest.ranked_items()
+        titles = [item["title"] for item in items]
+
+        self.assertEqual(len(items), 3)
+        self.assertNotIn("Unrelated deep dive", titles)
+
+        mlops = next(item for item in items if "MLOps" in item["title"])
+        self.assertEqual(mlops["score"], 9.5)
+        self.assertEqual(mlops["tier"], "high")
+        self.assertEqual(mlops["dates"], ["2026-01-12", "2026-01-13"])
+
+        ocr = next(item for item in items if "OCR" in item["title"])
+        self.assertEqual(ocr["score"], 9.0)
+
+        # Highest scores first
+        self.assertEqual(titles[0], mlops["title"])
+
+    def test_same_day_is_merged_once(self):
+        """Test that re-adding an already merged day is a no-op."""
+        digest = WeeklyDigest()
+        digest.add_briefing(make_briefing("2026-01-12", MONDAY_BRIEFING), "2026-01-12")
+
+        merged = digest.add_briefing(make_briefing("2026-01-12", MONDAY_BRIEFING), "2026-01-12")
+
+        self.assertEqual(merged, 0)
+
+    def test_prune_drops_old_days(self):
+        """Test that pruning forgets days outside the window."""
+        digest = WeeklyDigest()
+        digest.add_briefing(make_briefing("2026-01-12", MONDAY_BRIEFING), "2026-01-12")
+        digest.add_briefing(make_briefing("2026-01-13", TUESDAY_BRIEFING), "2026-01-13")
+
+        digest.prune("2026-01-13")
+
+        ocr = next(item for item in digest.ranked_items() if "OCR" in item["title"])
+        self.assertEqual(ocr["score"], 8.0)
+        self.assertEqual(digest.dates, ["2026-01-13"])
+
+    def test_to_markdown(self):
+        """Test rendering the digest as markdown."""
+        digest = WeeklyDigest()
+        digest.add_briefing(make_briefing("2026-01-12", MONDAY_BRIEFING), "2026-01-12")
+
+        markdown_text = digest.to_markdown("AI Weekly Digest", summary="Big week for OCR.")
+
+        self.assertTrue(markdown_text.startswith("# AI Weekly Digest"))
+        self.assertIn("Big week for OCR.", markdown_text)
+        self.assertIn("- **Link:** https://arxiv.org/abs/2601.00001", markdown_text)
+        self.assertIn("- **Seen in:** January 12", markdown_text)
+
+
+class TestBuildWeeklyDigest(unittest.TestCase):
+    """Test cases for building the digest from the store."""
+
+    def setUp(self):
+        """Set up a store with two daily briefings."""
+        self.archive_dir = tempfile.TemporaryDirectory()
+        self.store = BriefingStore(directory=self.archive_dir.name)
+        self.store.save(make_briefing("2026-01-12", MONDAY_BRIEFING))
+        self.store.save(make_briefing("2026-01-13", TUESDAY_BRIEFING))
+
+    def tearDown(self):
+        """Clean up the archive directory."""
+        self.archive_dir.cleanup()
+
+    def test_build_without_summary(self):
+        """Test building the digest without any model call."""
+        result = build_weekly_digest(self.store, end=date(2026, 1, 13))
+
+        self.assertEqual(result["title"], "Weekly Digest")
+        self.assertEqual(result["item_count"], 3)
+        self.assertEqual(result["source_dates"], ["2026-01-12", "2026-01-13"])
+        self.assertIn("Faster OCR Transformers", result["briefing"])
+        self.assertIsNotNone(self.store.load_state("weekly_digest"))
+
+    def test_build_with_single_summary_call(self):
+        """Test that summarizing makes exactly one call without tools or thinking."""
+        mock_text_block = Mock()
+        mock_text_block.type = "text"
+        mock_text_block.text = "A strong week for document AI."
+        mock_client = Mock()
+        mock_client.messages.create.return_value = Mock(content=[mock_text_block])
+
+        result = build_weekly_digest(self.store, end=date(2026, 1, 13), client=mock_client)
+
+        mock_client.messages.create.assert_called_once()
+        call_kwargs = mock_client.messages.create.call_args[1]
+        self.assertNotIn("tools", call_kwargs)
+        self.assertNotIn("thinking", call_kwargs)
+        self.assertIn("A strong week for document AI.", result["briefing"])
+
+    def test_build_is_incremental(self):
+        """Test that a second build doesn't read days already merged."""
+        build_weekly_digest(self.store, end=date(2026, 1, 13))
+        state = self.store.load_state("weekly_digest")
+        self.assertEqual(state["dates"], ["2026-01-12", "2026-01-13"])
+
+        self.store.save(make_briefing("2026-01-14", MONDAY_BRIEFING))
+        with patch.object(self.store, 'load', wraps=self.store.load) as mock_load:
+            result = build_weekly_digest(self.store, end=date(2026, 1, 14))
+
+        mock_load.assert_called_once_with("2026-01-14")
+        self.assertEqual(result["source_dates"], ["2026-01-12", "2026-01-13", "2026-01-14"])
+
+        result = build_weekly_digest(self.store, end=date(2026, 1, 19))
+
+        # Monday the 12th has fallen out of the 7 day window
+        self.assertEqual(result["source_dates"], ["2026-01-13", "2026-01-14"])
+
+    def test_backdated_build_excludes_later_days(self):
+        """Test that days after end are left out without being dropped from the running digest."""
+        self.store.save(make_briefing("2026-01-14", TUESDAY_BRIEFING))
+        build_weekly_digest(self.store, end=date(2026, 1, 14))
+
+        result = build_weekly_digest(self.store, end=date(2026, 1, 12))
+
+        self.assertEqual(result["source_dates"], ["2026-01-12"])
+        self.assertNotIn("Small Tool", result["briefing"])
+        self.assertNotIn("9.5", result["briefing"])
+        state = self.store.load_state("weekly_digest")
+        self.assertEqual(state["dates"], ["2026-01-12", "2026-01-13", "2026-01-14"])
+
+    def test_days_merged_as_they_are_saved(self):
+        """Test that the weekly build reads no briefings when each day was merged on save."""
+        store = BriefingStore(directory=os.path.join(self.archive_dir.name, "fresh"))
+        for day in range(13, 20):
+            briefing_data = make_briefing(f"2026-01-{day}", TUESDAY_BRIEFING if day % 2 else MONDAY_BRIEFING)
+            store.save(briefing_data)
+            update_weekly_digest(store, briefing_data)
+
+        # Re-running a day replaces its items instead of merging them twice
+        rerun = make_briefing("2026-01-19", MONDAY_BRIEFING)
+        store.save(rerun)
+        update_weekly_digest(store, rerun)
+
+        with patch.object(store, 'load', wraps=store.load) as mock_load:
+            result = build_weekly_digest(store, end=date(2026, 1, 19))
+
+        mock_load.assert_not_called()
+        self.assertEqual(len(result["source_dates"]), 7)
+        ocr = next(item for item in WeeklyDigest.from_dict(store.load_state("weekly_digest")).ranked_items()
+                   if "OCR" in item["title"])
+        self.assertEqual(ocr["dates"], result["source_dates"])
+
+
+if __name__ == '__main__':
+    unittest.main()